@@ -4,22 +4,70 @@
 Automatically restarts the application when Python files are modified.
 """
 
+import importlib.util
+import os
+import queue
+import select
 import sys
 import time
 import subprocess
 import signal
+import threading
 from pathlib import Path
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 
+# Quiet period after the last change before restarting
+DEBOUNCE_SECONDS = 0.3
+
+# Filesystems where native change notifications are unreliable
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "9p", "fuse.sshfs"}
+
+# Package source tree that is watched and restarted on change
+SOURCE_DIR = Path(__file__).parent / "src" / "ttydal"
+
+
+def is_network_mount(path: Path) -> bool:
+    """Check whether a path lives on a network filesystem (Linux only)."""
+    try:
+        with open("/proc/mounts", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+
+    resolved = str(path.resolve())
+    best_mount, best_type = "", ""
+    for mount_point, fs_type in mounts:
+        if resolved == mount_point or resolved.startswith(mount_point.rstrip("/") + "/"):
+            if len(mount_point) > len(best_mount):
+                best_mount, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+
+def create_observer(watch_path: Path):
+    """Create a native observer, or a polling one where events may be missed.
+
+    Polling is used when TTYDAL_DEV_POLL=1 is set or the watched directory is
+    on a network mount (SMB/CIFS, NFS, ...).
+    """
+    if os.environ.get("TTYDAL_DEV_POLL") == "1" or is_network_mount(watch_path):
+        print("Using polling file watcher")
+        return PollingObserver(timeout=0.5)
+    return Observer()
+
+
 class TtydalRestarter(FileSystemEventHandler):
     """File system event handler that restarts ttydal on Python file changes."""
 
     def __init__(self):
         self.process = None
         self.restart_requested = False
-        self.debounce_timer = None
+        # Changed paths are coalesced by a single long-lived debouncer thread
+        self._events: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._debouncer = threading.Thread(target=self._debounce_loop, daemon=True)
+        self._debouncer.start()
 
     def start_app(self):
         """Start the ttydal application."""
@@ -30,13 +78,29 @@ class TtydalRestarter(FileSystemEventHandler):
         print("Starting ttydal...")
         print("=" * 60 + "\n")
 
-        # Start ttydal through uv run (works with local package)
         self.process = subprocess.Popen(
-            ["uv", "run", "ttydal"],
+            self._app_command(),
             stdout=sys.stdout,
             stderr=sys.stderr,
         )
 
+    @staticmethod
+    def _app_command() -> list[str]:
+        """Get the command used to launch ttydal.
+
+        When the watcher already runs inside the project environment, reuse its
+        interpreter directly to skip uv's environment resolution on every restart.
+        That's only safe if it imports ttydal from the watched source tree (an
+        editable install); any other install would restart stale code.
+        """
+        spec = importlib.util.find_spec("ttydal")
+        if spec is not None and spec.origin is not None:
+            origin = Path(spec.origin).resolve()
+            if origin.is_relative_to(SOURCE_DIR.resolve()):
+                return [sys.executable, "-c", "import ttydal; ttydal.main()"]
+        # Start ttydal through uv run (works with local package)
+        return ["uv", "run", "ttydal"]
+
     def stop_app(self):
         """Stop the running ttydal application."""
         if self.process:
@@ -47,7 +111,7 @@ class TtydalRestarter(FileSystemEventHandler):
             # Send SIGTERM for graceful shutdown
             self.process.terminate()
             try:
-                self.process.wait(timeout=2)
+                self._wait_for_exit(timeout=2)
             except subprocess.TimeoutExpired:
                 # Force kill if it doesn't stop gracefully
                 self.process.kill()
@@ -55,6 +119,27 @@ class TtydalRestarter(FileSystemEventHandler):
 
             self.process = None
 
+    def _wait_for_exit(self, timeout: float):
+        """Wait for the app process to exit without polling where possible.
+
+        Uses a pidfd (Linux 5.3+) that becomes readable when the process exits,
+        falling back to Popen.wait() elsewhere.
+
+        Raises:
+            subprocess.TimeoutExpired: If the process is still running after timeout
+        """
+        try:
+            fd = os.pidfd_open(self.process.pid)
+        except (AttributeError, OSError):
+            self.process.wait(timeout=timeout)
+            return
+
+        try:
+            select.select([fd], [], [], timeout)
+        finally:
+            os.close(fd)
+        self.process.wait(timeout=0)
+
     def restart_app(self):
         """Restart the ttydal application."""
         self.stop_app()
@@ -65,25 +150,34 @@ class TtydalRestarter(FileSystemEventHandler):
         """Handle file modification events."""
         if event.is_directory:
             return
+        self._events.put(event.src_path)
 
-        # Only restart for Python files
-        if not event.src_path.endswith('.py'):
-            return
-
-        # Ignore __pycache__ and .pyc files
-        if '__pycache__' in event.src_path or event.src_path.endswith('.pyc'):
-            return
+    @staticmethod
+    def _is_relevant(path: str) -> bool:
+        """Check whether a changed path should trigger a restart."""
+        # Only restart for Python files, ignoring __pycache__ and .pyc files
+        return path.endswith(".py") and "__pycache__" not in path
 
-        print(f"\nFile changed: {event.src_path}")
-        print("Restarting ttydal...\n")
+    def _debounce_loop(self):
+        """Merge bursts of change events into a single restart."""
+        while True:
+            changed = set()
+            path = self._events.get()
+            while True:
+                if self._is_relevant(path):
+                    changed.add(path)
+                try:
+                    path = self._events.get(timeout=DEBOUNCE_SECONDS)
+                except queue.Empty:
+                    break
 
-        # Debounce: wait a bit in case multiple files change at once
-        if self.debounce_timer:
-            self.debounce_timer.cancel()
+            if not changed:
+                continue
 
-        import threading
-        self.debounce_timer = threading.Timer(0.3, self.restart_app)
-        self.debounce_timer.start()
+            for path in sorted(changed):
+                print(f"\nFile changed: {path}")
+            print("Restarting ttydal...\n")
+            self.restart_app()
 
 
 def main():
@@ -94,30 +188,30 @@ def main():
     print("\nWatching for changes in: src/ttydal/")
     print("Press Ctrl+C to stop\n")
 
-    # Create event handler and observer
-    event_handler = TtydalRestarter()
-    observer = Observer()
-
     # Watch the src/ttydal directory
-    watch_path = Path(__file__).parent / "src" / "ttydal"
+    watch_path = SOURCE_DIR
     if not watch_path.exists():
         print(f"Error: Directory not found: {watch_path}")
         sys.exit(1)
 
+    # Create event handler and observer
+    event_handler = TtydalRestarter()
+    observer = create_observer(watch_path)
+
     observer.schedule(event_handler, str(watch_path), recursive=True)
     observer.start()
 
+    # Block the main thread until Ctrl+C instead of polling
+    stop = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
     # Start the app initially
     event_handler.start_app()
 
-    try:
-        # Keep the watcher running
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        print("\n\nShutting down watcher...")
-        observer.stop()
-        event_handler.stop_app()
+    stop.wait()
+    print("\n\nShutting down watcher...")
+    observer.stop()
+    event_handler.stop_app()
 
     observer.join()
     print("Watcher stopped. Goodbye!")
@@ -90,14 +90,12 @@ def main() -> None:
         traceback.print_exc()
         sys.exit(1)
     finally:
-        log("Performing final cleanup...")
-        if app is not None:
+        # Ensure player is shutdown
+        player = getattr(app, "player", None)
+        if player is not None:
+            log("Performing final cleanup...\n  - Final player shutdown check...")
             try:
-                # Ensure player is shutdown
-                if hasattr(app, "player"):
-                    log("  - Final player shutdown check...")
-                    app.player.shutdown()
+                player.shutdown()
             except Exception as e:
                 log(f"  - Error during final cleanup: {e}")
-        log("Application exited")
-        log("=" * 80)
+        log(f"Application exited\n{'=' * 80}")
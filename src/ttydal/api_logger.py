@@ -1,21 +1,68 @@
 """HTTP API request/response logger for ttydal.
 
-This module intercepts all HTTP requests made by the application and logs
-them to a dedicated debug-api.log file with full details.
+This module hooks the Tidal client's HTTP session and logs its requests
+to a dedicated debug-api.log file with full details.
 """
 
+import atexit
 import json
+import os
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Any
 
+from ttydal.config import ConfigManager
 from ttydal.dirs import log_dir
 
+_SEP = "=" * 100
+
+# ASCII art header
+_ASCII_ART = """
+ ______   ______   __  __     _____     ______     __              ______     ______   __
+/\\__  _\\ /\\__  _\\ /\\ \\_\\ \\   /\\  __-.  /\\  __ \\   /\\ \\            /\\  __ \\   /\\  == \\ /\\ \\
+\\/_/\\ \\/ \\/_/\\ \\/ \\ \\____ \\  \\ \\ \\/\\ \\ \\ \\  __ \\  \\ \\ \\____       \\ \\  __ \\  \\ \\  _-/ \\ \\ \\
+   \\ \\_\\    \\ \\_\\  \\/\\_____\\  \\ \\____-  \\ \\_\\ \\_\\  \\ \\_____\\       \\ \\_\\ \\_\\  \\ \\_\\    \\ \\_\\
+    \\/_/     \\/_/   \\/_____/   \\/____/   \\/_/\\/_/   \\/_____/        \\/_/\\/_/   \\/_/     \\/_/
+"""
+
+# Fixed ASCII scaffolding of the log output, encoded once at import
+_SESSION_HEADER_OPEN_B = (
+    f"\n{_SEP}\n{_ASCII_ART}API Logging Session started at ".encode("ascii")
+)
+_SESSION_HEADER_CLOSE_B = f"\n{_SEP}\n\n".encode("ascii")
+_ENTRY_OPEN_B = f"\n{_SEP}\n[".encode("ascii")
+_ENTRY_METHOD_B = f"] HTTP REQUEST/RESPONSE\n{_SEP}\n\n>>> REQUEST:\nMethod: ".encode(
+    "ascii"
+)
+_ENTRY_URL_B = b"\nURL: "
+_ENTRY_REQ_HEADERS_B = b"\n\nHeaders:\n"
+_ENTRY_COOKIES_B = b"\n\nCookies:\n"
+_ENTRY_REQ_BODY_B = b"\n\nBody:\n"
+_ENTRY_STATUS_B = b"\n\n<<< RESPONSE:\nStatus: "
+_ENTRY_RESP_HEADERS_B = b"\n\nHeaders:\n"
+_ENTRY_RESP_BODY_B = b"\n\nBody (FULL CONTENT, NO TRUNCATION):\n"
+_ENTRY_CLOSE_B = f"\n\n{_SEP}\n\n".encode("ascii")
+
+# Shared stand-in for requests made without explicit headers (never mutated)
+_EMPTY_HEADERS: dict = {}
+
+# How long the api_logging_enabled flag is trusted before re-reading config
+_ENABLED_CACHE_TTL = 2.0
+
+# Entries waiting for the writer thread before requests start to wait
+_WRITE_QUEUE_SIZE = 1024
+
+# How long a request waits for room in a full write queue before its entry
+# is dropped (and counted, see _writer_loop)
+_WRITE_QUEUE_TIMEOUT = 0.5
+
 
 class APILogger:
     """Singleton HTTP request/response logger."""
 
     _instance = None
-    _original_request = None
 
     def __new__(cls):
         """Ensure only one instance exists."""
@@ -32,43 +79,147 @@ class APILogger:
         self.log_dir = log_dir()
         self.log_file = self.log_dir / "debug-api.log"
         self._file_setup_done = False
+        self._fd: int | None = None
+        self._setup_lock = threading.Lock()
+        self._write_q: queue.Queue[list[bytes] | None] = queue.Queue(
+            maxsize=_WRITE_QUEUE_SIZE
+        )
+        # Entries dropped because the queue stayed full, not yet reported
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._writer: threading.Thread | None = None
+        self._enabled_cached: bool | None = None
+        self._enabled_ts = 0.0
+        # Session the response hook is attached to while logging is enabled
+        self._session: Any = None
+        # (epoch second, formatted "%Y-%m-%d %H:%M:%S") for timestamp reuse
+        self._last_sec: tuple[int, str] = (0, "")
         self._initialized = True
 
     def _is_logging_enabled(self) -> bool:
-        """Check if API logging is enabled in config."""
-        try:
-            from ttydal.config import ConfigManager
+        """Check if API logging is enabled in config.
 
-            config = ConfigManager()
-            return config.api_logging_enabled
+        The result is cached for a short time since this runs on every request.
+        """
+        now = time.monotonic()
+        if (
+            self._enabled_cached is not None
+            and now - self._enabled_ts < _ENABLED_CACHE_TTL
+        ):
+            return self._enabled_cached
+
+        try:
+            enabled = ConfigManager().api_logging_enabled
         except Exception:
-            return False
+            enabled = False
+        self._enabled_cached = enabled
+        self._enabled_ts = now
+        return enabled
+
+    def _timestamp(self) -> str:
+        """Return the current local time with millisecond precision.
+
+        The date/time part is only re-formatted when the second changes.
+        """
+        now = time.time()
+        sec = int(now)
+        last_sec, sec_str = self._last_sec
+        if sec != last_sec:
+            sec_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._last_sec = (sec, sec_str)
+        return f"{sec_str}.{int((now - sec) * 1000):03d}"
+
+    def invalidate_enabled(self) -> None:
+        """Re-read the enabled flag after the config switch changed.
+
+        Attaches or detaches the response hook to match.
+        """
+        self._enabled_cached = None
+        self._sync_hook()
 
     def _setup_log_file(self) -> None:
         """Setup the API log file (called lazily on first log)."""
         if self._file_setup_done:
             return
 
+        with self._setup_lock:
+            if not self._file_setup_done:
+                self._open_log_file()
+
+    def _open_log_file(self) -> None:
+        """Open the log file, write the session header and start the writer."""
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # ASCII art header
-        ascii_art = """
- ______   ______   __  __     _____     ______     __              ______     ______   __
-/\\__  _\\ /\\__  _\\ /\\ \\_\\ \\   /\\  __-.  /\\  __ \\   /\\ \\            /\\  __ \\   /\\  == \\ /\\ \\
-\\/_/\\ \\/ \\/_/\\ \\/ \\ \\____ \\  \\ \\ \\/\\ \\ \\ \\  __ \\  \\ \\ \\____       \\ \\  __ \\  \\ \\  _-/ \\ \\ \\
-   \\ \\_\\    \\ \\_\\  \\/\\_____\\  \\ \\____-  \\ \\_\\ \\_\\  \\ \\_____\\       \\ \\_\\ \\_\\  \\ \\_\\    \\ \\_\\
-    \\/_/     \\/_/   \\/_____/   \\/____/   \\/_/\\/_/   \\/_____/        \\/_/\\/_/   \\/_/     \\/_/
-"""
+        # Keep a single append-only fd open for the whole session; it is only
+        # ever touched by the writer thread, and O_APPEND keeps appends atomic
+        self._fd = os.open(
+            self.log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
 
         # Write session start marker
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(f"\n{'=' * 100}\n")
-            f.write(ascii_art)
-            f.write(f"API Logging Session started at {datetime.now().isoformat()}\n")
-            f.write(f"{'=' * 100}\n\n")
+        self._write_q.put(
+            [
+                _SESSION_HEADER_OPEN_B,
+                datetime.now().isoformat().encode("ascii"),
+                _SESSION_HEADER_CLOSE_B,
+            ]
+        )
+
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="api-logger-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self._close)
 
         self._file_setup_done = True
 
+    def _writer_loop(self) -> None:
+        """Drain queued log entries straight to the log file descriptor."""
+        while True:
+            chunks = self._write_q.get()
+            if chunks is None:
+                break
+            with self._dropped_lock:
+                dropped, self._dropped = self._dropped, 0
+            if dropped:
+                # Leave a trace in the log so gaps don't go unnoticed
+                chunks = [
+                    f"\n[API Logger] {dropped} entries dropped: the log writer "
+                    "could not keep up\n".encode("ascii"),
+                    *chunks,
+                ]
+            try:
+                self._write_all(chunks)
+            except Exception as e:
+                # Silently fail - don't disrupt the application
+                print(f"[API Logger] Failed to write log: {e}")
+        os.close(self._fd)
+
+    def _write_all(self, chunks: list[bytes]) -> None:
+        """Write an entry's buffers to the log file, all of them.
+
+        Args:
+            chunks: Buffers making up one log entry
+        """
+        if hasattr(os, "writev"):
+            # One syscall for all of an entry's buffers in the usual case
+            written = os.writev(self._fd, chunks)
+            if written == sum(len(chunk) for chunk in chunks):
+                return
+            # Short write (disk full, signal, ...): finish the rest below
+            remaining = memoryview(b"".join(chunks))[written:]
+        else:
+            remaining = memoryview(b"".join(chunks))
+        while remaining:
+            remaining = remaining[os.write(self._fd, remaining) :]
+
+    def _close(self) -> None:
+        """Stop the writer thread after it has drained pending entries."""
+        if self._writer is None or not self._writer.is_alive():
+            return
+        self._write_q.put(None)
+        self._writer.join(timeout=2)
+
     def _format_headers(self, headers: dict) -> str:
         """Format headers for logging.
 
@@ -81,10 +232,7 @@ class APILogger:
         if not headers:
             return "  (no headers)"
 
-        lines = []
-        for key, value in headers.items():
-            lines.append(f"  {key}: {value}")
-        return "\n".join(lines)
+        return "\n".join(f"  {key}: {value}" for key, value in headers.items())
 
     def _format_cookies(self, cookies: Any) -> str:
         """Format cookies for logging.
@@ -108,13 +256,10 @@ class APILogger:
         else:
             return f"  {cookies}"
 
-        if not cookie_dict:
-            return "  (no cookies)"
-
-        lines = []
-        for key, value in cookie_dict.items():
-            lines.append(f"  {key}: {value}")
-        return "\n".join(lines)
+        return (
+            "\n".join(f"  {key}: {value}" for key, value in cookie_dict.items())
+            or "  (no cookies)"
+        )
 
     def _format_body(self, body: Any, content_type: str = "") -> str:
         """Format request/response body for logging.
@@ -148,7 +293,7 @@ class APILogger:
         body_str = str(body)
 
         # Try to parse as JSON for pretty printing
-        if "json" in content_type.lower() or body_str.strip().startswith(("{", "[")):
+        if "json" in content_type.lower() or body_str.lstrip().startswith(("{", "[")):
             try:
                 parsed = json.loads(body_str)
                 return "  " + json.dumps(parsed, indent=2).replace("\n", "\n  ")
@@ -158,6 +303,38 @@ class APILogger:
         # Return as-is with indentation, NO TRUNCATION
         return "  " + body_str.replace("\n", "\n  ")
 
+    def _format_body_bytes(self, body: Any, content_type: str = "") -> bytes:
+        """Format a body for logging straight to encoded bytes.
+
+        Raw non-JSON bytes bodies are indented without being decoded to str
+        and re-encoded; JSON (pretty-printed) and other bodies go through
+        _format_body.
+
+        Args:
+            body: Body content (str, bytes, dict, etc.)
+            content_type: Content-Type header value
+
+        Returns:
+            Formatted body as UTF-8 bytes
+        """
+        if (
+            not isinstance(body, bytes)
+            or not body
+            or "json" in content_type.lower()
+            or body.lstrip().startswith((b"{", b"["))
+        ):
+            return self._format_body(body, content_type).encode("utf-8")
+
+        # Only non-ASCII bodies need a decode to tell text from binary data
+        if not body.isascii():
+            try:
+                body.decode("utf-8")
+            except UnicodeDecodeError:
+                return f"  (binary data, {len(body)} bytes)".encode("ascii")
+
+        # Return as-is with indentation, NO TRUNCATION
+        return b"  " + body.replace(b"\n", b"\n  ")
+
     def log_request_response(
         self,
         method: str,
@@ -190,120 +367,103 @@ class APILogger:
         # Setup log file lazily (only if logging is enabled)
         self._setup_log_file()
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        timestamp = self._timestamp()
 
-        log_entry = []
-        log_entry.append(f"\n{'=' * 100}")
-        log_entry.append(f"[{timestamp}] HTTP REQUEST/RESPONSE")
-        log_entry.append(f"{'=' * 100}")
-
-        # Request section
-        log_entry.append("\n>>> REQUEST:")
-        log_entry.append(f"Method: {method}")
-        log_entry.append(f"URL: {url}")
-        log_entry.append("\nHeaders:")
-        log_entry.append(self._format_headers(request_headers))
-        log_entry.append("\nCookies:")
-        log_entry.append(self._format_cookies(request_cookies))
-        log_entry.append("\nBody:")
-
-        content_type = (
+        request_content_type = (
             request_headers.get("Content-Type", "") if request_headers else ""
         )
-        log_entry.append(self._format_body(request_body, content_type))
-
-        # Response section
-        log_entry.append("\n<<< RESPONSE:")
-        log_entry.append(f"Status: {response_status}")
-        log_entry.append(f"Elapsed: {elapsed_time:.3f}s")
-        log_entry.append("\nHeaders:")
-        log_entry.append(self._format_headers(response_headers))
-        log_entry.append("\nBody (FULL CONTENT, NO TRUNCATION):")
-
         response_content_type = (
             response_headers.get("Content-Type", "") if response_headers else ""
         )
-        log_entry.append(self._format_body(response_body, response_content_type))
-
-        log_entry.append(f"\n{'=' * 100}\n")
 
-        # Write to file
+        chunks = [
+            _ENTRY_OPEN_B,
+            timestamp.encode("ascii"),
+            # Request section
+            _ENTRY_METHOD_B,
+            method.encode("utf-8"),
+            _ENTRY_URL_B,
+            url.encode("utf-8"),
+            _ENTRY_REQ_HEADERS_B,
+            self._format_headers(request_headers).encode("utf-8"),
+            _ENTRY_COOKIES_B,
+            self._format_cookies(request_cookies).encode("utf-8"),
+            _ENTRY_REQ_BODY_B,
+            self._format_body_bytes(request_body, request_content_type),
+            # Response section
+            _ENTRY_STATUS_B,
+            f"{response_status}\nElapsed: {elapsed_time:.3f}s".encode("ascii"),
+            _ENTRY_RESP_HEADERS_B,
+            self._format_headers(response_headers).encode("utf-8"),
+            _ENTRY_RESP_BODY_B,
+            self._format_body_bytes(response_body, response_content_type),
+            _ENTRY_CLOSE_B,
+        ]
+
+        # Hand off to the writer thread. If it falls far behind, wait a
+        # little rather than stall the request; past that, drop the entry and
+        # let the writer note the gap in the log
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write("\n".join(log_entry))
-        except Exception as e:
-            # Silently fail - don't disrupt the application
-            print(f"[API Logger] Failed to write log: {e}")
+            self._write_q.put(chunks, timeout=_WRITE_QUEUE_TIMEOUT)
+        except queue.Full:
+            with self._dropped_lock:
+                self._dropped += 1
 
-    def install(self) -> None:
-        """Install HTTP request interceptor.
+    def _log_response_hook(self, response: Any, *args: Any, **kwargs: Any) -> Any:
+        """requests response hook that logs the request/response pair.
 
-        This monkey-patches the requests library to intercept all HTTP calls.
+        Runs once the response headers are in, before requests reads the body
+        of non-streamed responses.
         """
-        try:
-            import requests
-
-            # Store original request method if not already stored
-            if APILogger._original_request is None:
-                APILogger._original_request = requests.Session.request
-
-            # Create wrapper function
-            def logged_request(
-                session_self: Any, method: str, url: str, **kwargs: Any
-            ) -> Any:
-                """Wrapped request method that logs all calls."""
-                import time
-
-                # Extract request details
-                request_headers = kwargs.get("headers", {})
-                request_cookies = kwargs.get("cookies", session_self.cookies)
-                request_body = kwargs.get("data") or kwargs.get("json")
-
-                # Make the actual request
-                start_time = time.time()
-                response = APILogger._original_request(
-                    session_self, method, url, **kwargs
-                )
-                elapsed_time = time.time() - start_time
-
-                # Extract response details
-                response_headers = dict(response.headers)
-                response_status = response.status_code
-
-                # Get response body - be careful not to consume the stream
-                try:
-                    # For streaming responses, we can't easily log the full body
-                    # without consuming it. Try to get it safely.
-                    if hasattr(response, "_content") and response._content is not None:
-                        response_body = response._content
-                    elif hasattr(response, "text"):
-                        response_body = response.text
-                    else:
-                        response_body = "(streaming response, body not captured)"
-                except Exception:
-                    response_body = "(could not capture response body)"
-
-                # Log the request/response
-                self.log_request_response(
-                    method=method.upper(),
-                    url=url,
-                    request_headers=request_headers,
-                    request_cookies=request_cookies,
-                    request_body=request_body,
-                    response_status=response_status,
-                    response_headers=response_headers,
-                    response_body=response_body,
-                    elapsed_time=elapsed_time,
-                )
-
-                return response
-
-            # Patch the Session.request method
-            requests.Session.request = logged_request
-
-        except ImportError:
-            # requests library not available, skip patching
-            pass
+        request = response.request
+
+        # Reading the body of a streamed response would consume the stream
+        if kwargs.get("stream"):
+            response_body = "(streaming response, body not captured)"
+        else:
+            try:
+                response_body = response.content
+            except Exception:
+                response_body = "(could not capture response body)"
+
+        self.log_request_response(
+            method=request.method.upper(),
+            url=request.url,
+            request_headers=request.headers or _EMPTY_HEADERS,
+            request_cookies=getattr(request, "_cookies", None),
+            request_body=request.body,
+            response_status=response.status_code,
+            # CaseInsensitiveDict, no copy needed
+            response_headers=response.headers,
+            response_body=response_body,
+            elapsed_time=response.elapsed.total_seconds(),
+        )
+        return response
+
+    def install(self, session: Any) -> None:
+        """Log the HTTP traffic of a requests session.
+
+        The response hook is only registered on the session while API
+        logging is enabled, so requests pay nothing otherwise;
+        invalidate_enabled() attaches or detaches it when the setting changes.
+
+        Args:
+            session: requests.Session to log
+        """
+        self._session = session
+        self._sync_hook()
+
+    def _sync_hook(self) -> None:
+        """Attach or detach the response hook to match the enabled flag."""
+        if self._session is None:
+            return
+        hooks = self._session.hooks["response"]
+        attached = self._log_response_hook in hooks
+        enabled = self._is_logging_enabled()
+        if enabled and not attached:
+            hooks.append(self._log_response_hook)
+        elif attached and not enabled:
+            hooks.remove(self._log_response_hook)
 
 
 # Global logger instance
@@ -322,11 +482,11 @@ def get_api_logger() -> APILogger:
     return _api_logger
 
 
-def install_api_logger() -> None:
-    """Install the API logger to intercept all HTTP requests.
+def install_api_logger(session: Any) -> None:
+    """Install the API logger on a requests session.
 
-    Call this early in your application startup to ensure all
-    HTTP requests are logged.
+    Args:
+        session: requests.Session whose requests should be logged
     """
     logger = get_api_logger()
-    logger.install()
+    logger.install(session)
@@ -1,11 +1,20 @@
 """Main TUI application for ttydal."""
 
+import asyncio
+import os
+import subprocess
+import threading
+import time
+
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.widgets import Footer, TabbedContent, TabPane
+from textual.widgets import Footer, ListView, TabbedContent, TabPane
+from textual.worker import Worker, WorkerCancelled
 
 # Import textual_image.renderable before the app starts to determine best rendering method
-# This must be done before Textual starts its threads for input/output handling
+# This must be done before Textual starts its threads for input/output handling.
+# It can't be deferred to the first cover art: by then Textual owns stdin and the
+# terminal capability probe can't read its reply (PlayerBar needs it at startup anyway).
 import textual_image.renderable  # noqa: F401
 
 from ttydal.pages.player_page import PlayerPage
@@ -16,15 +25,28 @@ from ttydal.components.player_bar import PlayerBar
 from ttydal.components.login_modal import LoginModal
 from ttydal.components.search_modal import SearchModal
 from ttydal.components.cache_modal import CacheModal
+from ttydal.components.playlist_info_modal import PlaylistInfoModal
 from ttydal.components.albums_list import AlbumsList
 from ttydal.components.tracks_list import TracksList
 from ttydal.services.tracks_cache import TracksCache
 from ttydal.config import ConfigManager
+from ttydal.dirs import log_dir
+from ttydal.exceptions import TtydalError
 from ttydal.logger import log
 from ttydal.keybindings import get_key
 
 _k = lambda action: get_key("app", action)
 
+# Seconds between "Waiting for login" status updates
+_LOGIN_STATUS_INTERVAL = 20
+
+# Seconds to wait for mpv to shut down when the app exits
+_PLAYER_SHUTDOWN_TIMEOUT = 2.0
+
+# Tab pane IDs
+PLAYER_TAB = "player-tab"
+CONFIG_TAB = "config-tab"
+
 
 class TtydalApp(App):
     """Main ttydal TUI application."""
@@ -46,168 +68,203 @@ class TtydalApp(App):
     BINDINGS = [
         Binding(_k("show_player"), "show_player", "Player", show=True),
         Binding(_k("show_config"), "show_config", "Config", show=True),
-        Binding(_k("focus_albums"), "focus_albums", "Albums", show=True),
-        Binding(_k("focus_tracks"), "focus_tracks", "Tracks", show=True),
+        Binding(_k("focus_albums"), "player('focus_albums')", "Albums", show=True),
+        Binding(_k("focus_tracks"), "player('focus_tracks')", "Tracks", show=True),
         Binding(_k("open_search"), "open_search", "Search", show=True),
         Binding(_k("open_cache_info"), "open_cache_info", "Cache", show=True),
-        Binding(_k("toggle_play"), "toggle_play", "Play/Pause", show=True),
+        Binding(_k("toggle_play"), "player('toggle_playback')", "Play/Pause", show=True),
         Binding(_k("toggle_auto_play"), "toggle_auto_play", "Auto-Play", show=True),
         Binding(_k("toggle_shuffle"), "toggle_shuffle", "Shuffle", show=True),
         Binding(_k("toggle_vibrant_color"), "toggle_vibrant_color", "Vibrant", show=True),
-        Binding(_k("seek_backward"), "seek_backward", "Seek -10s", show=True),
-        Binding(_k("seek_forward"), "seek_forward", "Seek +10s", show=True),
-        Binding(_k("play_previous"), "play_previous", "Previous", show=True),
-        Binding(_k("play_next"), "play_next", "Next", show=True),
+        Binding(_k("seek_backward"), "player('seek_backward')", "Seek -10s", show=True),
+        Binding(_k("seek_forward"), "player('seek_forward')", "Seek +10s", show=True),
+        Binding(_k("play_previous"), "player('play_previous')", "Previous", show=True),
+        Binding(_k("play_next"), "player('play_next')", "Next", show=True),
         Binding(_k("open_debug_info"), "open_debug_info", "Debug", show=True),
         Binding(_k("quit"), "quit", "Quit", show=True),
     ]
 
     def __init__(self):
         """Initialize the application."""
-        log("TtydalApp.__init__() called")
         super().__init__()
-        log("  - super().__init__() completed")
-
-        log("  - Creating TidalClient...")
+        # These singletons are cheap to build (mpv is loaded lazily on first
+        # playback and main() has already read the config), so constructing
+        # them sequentially costs nothing worth parallelising
         self.tidal = TidalClient()
-        log("  - TidalClient created")
-
-        log("  - Creating Player...")
         self.player = MpvPlaybackEngine()
-        log("  - Player created")
-
-        log("  - Creating ConfigManager...")
         self.config = ConfigManager()
-        log(
-            f"  - ConfigManager created, theme={self.config.theme}, quality={self.config.quality}"
-        )
 
-        self.current_page = "player"
-        log("TtydalApp.__init__() completed")
+        self.login_modal: LoginModal | None = None
+        # Set once the current login flow's OAuth login completes (or can no
+        # longer complete); each flow gets its own event
+        self._login_done = asyncio.Event()
+        # Whether a manual check already completed the current login
+        self._login_confirmed = False
+        # Widget references, resolved on first use (see properties below)
+        self._player_page: PlayerPage | None = None
+        self._tabbed_content: TabbedContent | None = None
+        # Modals are built once and installed, then re-shown on each open
+        self._search_modal: SearchModal | None = None
+        self._search_data_key: tuple | None = None
+        self._cache_modal: CacheModal | None = None
+
+    @property
+    def player_page(self) -> PlayerPage:
+        """Get the player page (queried once, then cached)."""
+        if self._player_page is None:
+            self._player_page = self.query_one(PlayerPage)
+        return self._player_page
+
+    @property
+    def albums_list(self) -> AlbumsList:
+        """Get the albums list."""
+        return self.player_page.albums_list
+
+    @property
+    def tracks_list(self) -> TracksList:
+        """Get the tracks list."""
+        return self.player_page.tracks_list
+
+    @property
+    def player_bar(self) -> PlayerBar:
+        """Get the player bar."""
+        return self.player_page.player_bar
+
+    @property
+    def tabbed_content(self) -> TabbedContent:
+        """Get the main tabbed content (queried once, then cached)."""
+        if self._tabbed_content is None:
+            self._tabbed_content = self.query_one(TabbedContent)
+        return self._tabbed_content
 
     def compose(self) -> ComposeResult:
         """Compose the main application UI."""
-        log("TtydalApp.compose() called")
-        log("  - Creating TabbedContent with PlayerPage and ConfigPage...")
-
-        try:
-            with TabbedContent(initial="player-tab"):
-                with TabPane("(p)layer", id="player-tab"):
-                    log("    - Yielding PlayerPage...")
-                    yield PlayerPage()
-                    log("    - PlayerPage yielded")
-                with TabPane("(c)onfig", id="config-tab"):
-                    log("    - Yielding ConfigPage...")
-                    yield ConfigPage()
-                    log("    - ConfigPage yielded")
-            log("  - Yielding Footer...")
-            yield Footer()
-            log("  - Footer yielded")
-            log("TtydalApp.compose() completed")
-        except Exception as e:
-            log(f"ERROR in compose(): {e}")
-            raise
-
-    async def on_mount(self) -> None:
+        with TabbedContent(initial=PLAYER_TAB):
+            with TabPane("(p)layer", id=PLAYER_TAB):
+                yield PlayerPage()
+            with TabPane("(c)onfig", id=CONFIG_TAB):
+                yield ConfigPage()
+        yield Footer()
+
+    def on_mount(self) -> None:
         """Initialize application when mounted."""
-        log("TtydalApp.on_mount() called")
+        # Set the theme from config
+        self.theme = self.config.theme
 
-        try:
-            # Set the theme from config
-            log(f"  - Setting theme to: {self.config.theme}")
-            self.theme = self.config.theme
-            log("  - Theme set successfully")
-
-            # Check if user is logged in
-            log("  - Checking if user is logged in...")
-            if not self.tidal.load_session():
-                log("  - User not logged in, starting login flow in background...")
-                # Start login flow in background without blocking
-                self.set_timer(0.5, self.start_login_flow)
-            else:
-                log("  - User already logged in")
+        # Restore the session off the event loop (keyring + HTTP check)
+        self.run_worker(self._restore_session(), group="session")
 
-            log("TtydalApp.on_mount() completed")
-        except Exception as e:
-            log(f"ERROR in on_mount(): {e}")
-            import traceback
+    async def _restore_session(self) -> None:
+        """Load the saved session, then start loading albums or log in."""
+        logged_in = await asyncio.to_thread(self.tidal.load_session)
+
+        # The first albums fetch needs the session loaded
+        self.albums_list.initial_load()
 
-            log(traceback.format_exc())
-            raise
+        if not logged_in:
+            log("User not logged in, starting login flow in background...")
+            self.start_login_flow()
 
     def start_login_flow(self) -> None:
         """Start the login flow with modal."""
         log("Starting login flow with modal...")
         self.login_modal = LoginModal()
-        self.push_screen(self.login_modal)
+        self.push_screen(self.login_modal, self._on_login_modal_dismissed)
         self.run_worker(self.login_flow(), exclusive=True)
 
+    def _on_login_modal_dismissed(self, result: bool | None) -> None:
+        """Drop the modal reference once the user closes it.
+
+        Args:
+            result: Value the modal was dismissed with
+        """
+        self.login_modal = None
+
     async def login_flow(self) -> None:
         """Handle Tidal OAuth login flow."""
         log("login_flow() started")
+        # A fresh event, so a superseded flow can't wake this one up
+        login_done = asyncio.Event()
+        self._login_done = login_done
+        self._login_confirmed = False
 
         try:
             log("  - Calling tidal.login()...")
-            login_url, code = self.tidal.login()
-            log(f"  - Login URL: {login_url}")
-            log(f"  - Code: {code}")
+            login_url, code = await asyncio.to_thread(self.tidal.login)
+            log("  - Login URL: %s", login_url)
+            log("  - Code: %s", code)
+
+            # Update modal with login info once its widgets are mounted
+            login_modal = self.login_modal
+            if login_modal is not None:
+                await login_modal.mounted_event.wait()
+                login_modal.update_login_info(login_url, code)
 
-            # Update modal with login info
-            if hasattr(self, "login_modal") and self.login_modal:
-                self.login_modal.update_login_info(login_url, code)
-                # Force a refresh to show the new info
-                self.login_modal.refresh(layout=True)
+            # Wake up as soon as tidalapi's OAuth poll finishes, or a manual
+            # check from the modal succeeds
+            loop = asyncio.get_running_loop()
+            login_future = self.tidal.login_future
 
-            # Wait for login completion in background
-            import asyncio
+            # concurrent.futures callbacks can't be removed, so this one
+            # checks that its future still belongs to the current attempt
+            def on_login_future_done(future) -> None:
+                if future is self.tidal.login_future:
+                    loop.call_soon_threadsafe(login_done.set)
+
+            login_future.add_done_callback(on_login_future_done)
 
             log("  - Waiting for user to complete login (no timeout)...")
-            check_count = 0
-            while True:
-                await asyncio.sleep(2)
-                check_count += 1
-
-                if self.tidal.complete_login():
-                    log("  - Login successful!")
-                    if hasattr(self, "login_modal") and self.login_modal:
-                        self.login_modal.update_status("✓ Login successful!")
-                        await asyncio.sleep(1)
-                        try:
-                            self.pop_screen()
-                        except Exception:
-                            pass
-
-                    self.notify("Login successful!", severity="information")
-
-                    # Reload albums after login
-                    try:
-                        player_page = self.query_one(PlayerPage)
-                        albums_list_widget = player_page.query_one("AlbumsList")
-                        if hasattr(albums_list_widget, "load_albums"):
-                            albums_list_widget.load_albums()
-                    except Exception as e:
-                        log(f"  - Error reloading albums: {e}")
-                    return
-
-                # Update status every 10 checks
-                if (
-                    check_count % 10 == 0
-                    and hasattr(self, "login_modal")
-                    and self.login_modal
-                ):
+            login_started = time.monotonic()
+            ticker = self.set_interval(
+                _LOGIN_STATUS_INTERVAL,
+                lambda: self._show_login_wait(login_started),
+            )
+            try:
+                await login_done.wait()
+            finally:
+                ticker.stop()
+
+            logged_in = self._login_confirmed or await asyncio.to_thread(
+                self.tidal.complete_login
+            )
+            if not logged_in:
+                log("  - Login was not completed (code expired)")
+                if self.login_modal is not None:
                     self.login_modal.update_status(
-                        f"Waiting for login... ({check_count * 2}s)"
+                        "Login code expired. Close and try again."
                     )
+                self.notify("Login was not completed", severity="warning")
+                return
 
-        except Exception as e:
-            log(f"ERROR in login_flow(): {e}")
-            import traceback
+            log("  - Login successful!")
+            if self.login_modal is not None:
+                self.login_modal.update_status("✓ Login successful!")
+                await asyncio.sleep(1)
+                if isinstance(self.screen, LoginModal):
+                    self.pop_screen()
+                self.login_modal = None
+
+            self.notify("Login successful!", severity="information")
+
+            # Reload albums after login
+            self.albums_list.load_albums()
 
-            log(traceback.format_exc())
-            if hasattr(self, "login_modal") and self.login_modal:
+        except (TtydalError, OSError) as e:
+            log("ERROR in login_flow(): %s", e)
+            if self.login_modal is not None:
                 self.login_modal.update_status(f"Error: {e}")
             self.notify(f"Login error: {e}", severity="error")
 
+    def _show_login_wait(self, started: float) -> None:
+        """Show how long we've been waiting for login.
+
+        Args:
+            started: time.monotonic() when the wait began
+        """
+        if self.login_modal is not None:
+            elapsed = int(time.monotonic() - started)
+            self.login_modal.update_status(f"Waiting for login... ({elapsed}s)")
+
     def on_login_modal_check_login(self, message: LoginModal.CheckLogin) -> None:
         """Handle check login button press in modal.
 
@@ -215,193 +272,151 @@ class TtydalApp(App):
             message: Check login message
         """
         log("Manual login check requested")
-        if self.tidal.complete_login():
-            log("  - Login successful on manual check!")
-            if hasattr(self, "login_modal") and self.login_modal:
-                self.login_modal.update_status("✓ Login successful!")
-            self.notify("Login successful!", severity="information")
+        # Check in a worker so the app keeps handling input meanwhile
+        self.run_worker(self._check_login(), group="login-check", exclusive=True)
 
-            # Close modal
-            try:
-                self.pop_screen()
-            except Exception:
-                pass
-
-            # Reload albums
-            try:
-                player_page = self.query_one(PlayerPage)
-                albums_list_widget = player_page.query_one("AlbumsList")
-                if hasattr(albums_list_widget, "load_albums"):
-                    albums_list_widget.load_albums()
-            except Exception as e:
-                log(f"  - Error reloading albums: {e}")
+    async def _check_login(self) -> None:
+        """Check whether the user has completed the OAuth login."""
+        if await asyncio.to_thread(self.tidal.complete_login):
+            log("  - Login successful on manual check!")
+            # login_flow finishes the login (closes modal, reloads albums)
+            self._login_confirmed = True
+            self._login_done.set()
         else:
             log("  - Login not completed yet")
-            if hasattr(self, "login_modal") and self.login_modal:
+            if self.login_modal is not None:
                 self.login_modal.update_status(
                     "Not logged in yet. Please complete the login process."
                 )
 
     def action_show_player(self) -> None:
         """Switch to player page."""
-        tabbed_content = self.query_one(TabbedContent)
-        tabbed_content.active = "player-tab"
-        self.current_page = "player"
+        tabbed_content = self.tabbed_content
+        if tabbed_content.active != PLAYER_TAB:
+            tabbed_content.active = PLAYER_TAB
 
     def action_show_config(self) -> None:
         """Switch to config page."""
-        tabbed_content = self.query_one(TabbedContent)
-        tabbed_content.active = "config-tab"
-        self.current_page = "config"
-
-    def action_focus_albums(self) -> None:
-        """Focus albums list on player page."""
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.focus_albums()
-
-    def action_focus_tracks(self) -> None:
-        """Focus tracks list on player page."""
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.focus_tracks()
-
-    def action_toggle_play(self) -> None:
-        """Toggle play/pause globally on player page."""
-        log("TtydalApp.action_toggle_play() called")
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.toggle_playback()
-        else:
-            log(f"  - Not on player page (current: {self.current_page})")
+        tabbed_content = self.tabbed_content
+        if tabbed_content.active != CONFIG_TAB:
+            tabbed_content.active = CONFIG_TAB
 
-    def action_seek_backward(self) -> None:
-        """Seek backward 10 seconds."""
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.seek_backward()
+    def on_tabbed_content_tab_activated(
+        self, event: TabbedContent.TabActivated
+    ) -> None:
+        """Move focus into the player page when its tab becomes active.
 
-    def action_seek_forward(self) -> None:
-        """Seek forward 10 seconds."""
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.seek_forward()
+        Args:
+            event: Tab activated event
+        """
+        if event.pane.id == PLAYER_TAB and not self.player_page.has_focus_within:
+            self.player_page.action_focus_albums()
 
-    def action_toggle_auto_play(self) -> None:
-        """Toggle auto-play next track setting."""
-        log("TtydalApp.action_toggle_auto_play() called")
-        current_state = self.config.auto_play
-        new_state = not current_state
-        self.config.auto_play = new_state
-        log(f"  - Auto-play toggled: {current_state} -> {new_state}")
+    async def action_player(self, action: str) -> None:
+        """Run a PlayerPage action while the player tab is showing.
 
-        # Show notification
-        status = "enabled" if new_state else "disabled"
-        self.notify(f"Auto-play {status}", severity="information")
+        Player keys are bound here rather than on PlayerPage so they keep
+        working wherever focus is (the tabs bar, or nothing after a modal).
 
-    def action_toggle_shuffle(self) -> None:
-        """Toggle shuffle playback setting."""
-        log("TtydalApp.action_toggle_shuffle() called")
-        current_state = self.config.shuffle
-        new_state = not current_state
-        self.config.shuffle = new_state
-        log(f"  - Shuffle toggled: {current_state} -> {new_state}")
+        Args:
+            action: Name of the PlayerPage action to run
+        """
+        if self.tabbed_content.active == PLAYER_TAB:
+            await self.run_action(action, self.player_page)
 
-        # Notify TracksList to reshuffle if enabling
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.on_shuffle_changed(new_state)
+    def toggle_setting(self, name: str, label: str) -> bool:
+        """Flip a boolean config setting and tell the user.
 
-        # Show notification
-        status = "enabled" if new_state else "disabled"
-        self.notify(f"Shuffle {status}", severity="information")
+        Args:
+            name: ConfigManager property name (e.g. "shuffle")
+            label: Human-readable setting name for the log and notification
 
-    def action_toggle_vibrant_color(self) -> None:
-        """Toggle vibrant color setting (colorize player bar with album color)."""
-        log("TtydalApp.action_toggle_vibrant_color() called")
-        current_state = self.config.vibrant_color
+        Returns:
+            The new value of the setting
+        """
+        current_state = getattr(self.config, name)
         new_state = not current_state
-        self.config.vibrant_color = new_state
-        log(f"  - Vibrant color toggled: {current_state} -> {new_state}")
-
-        # Clear vibrant color from player bar if disabled
-        if self.current_page == "player" and not new_state:
-            player_page = self.query_one(PlayerPage)
-            player_bar = player_page.query_one(PlayerBar)
-            player_bar.update_vibrant_color(None)
+        setattr(self.config, name, new_state)
+        log("%s toggled: %s -> %s", label, current_state, new_state)
 
-        # Show notification
         status = "enabled" if new_state else "disabled"
-        self.notify(f"Vibrant color {status}", severity="information")
+        self.notify(f"{label} {status}", severity="information")
+        return new_state
 
-    def action_play_next(self) -> None:
-        """Play next track."""
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.play_next()
+    def action_toggle_auto_play(self) -> None:
+        """Toggle auto-play next track setting."""
+        self.toggle_setting("auto_play", "Auto-play")
 
-    def action_play_previous(self) -> None:
-        """Play previous track."""
-        if self.current_page == "player":
-            player_page = self.query_one(PlayerPage)
-            player_page.play_previous()
+    def action_toggle_shuffle(self) -> None:
+        """Toggle shuffle playback setting."""
+        new_state = self.toggle_setting("shuffle", "Shuffle")
+        if self.tabbed_content.active == PLAYER_TAB:
+            self.player_page.on_shuffle_changed(new_state)
+
+    def action_toggle_vibrant_color(self) -> None:
+        """Toggle vibrant color setting (colorize player bar with album color)."""
+        new_state = self.toggle_setting("vibrant_color", "Vibrant color")
+        if self.tabbed_content.active == PLAYER_TAB:
+            self.player_page.on_vibrant_color_changed(new_state)
 
     def action_open_search(self) -> None:
         """Open the fuzzy search modal."""
-        log("TtydalApp.action_open_search() called")
-
-        # Get albums from AlbumsList
-        albums = []
-        try:
-            player_page = self.query_one(PlayerPage)
-            albums_list = player_page.query_one(AlbumsList)
-            albums = albums_list.albums.copy()
-            log(f"  - Got {len(albums)} albums")
-        except Exception as e:
-            log(f"  - Error getting albums: {e}")
+        if self._search_modal is not None and self.screen is self._search_modal:
+            return
+        albums_list = self.albums_list
+        cache = TracksCache()
+
+        # Only rebuild the searchable data when albums or the cache changed
+        data_key = (albums_list.albums_version, cache.version)
+        if data_key != self._search_data_key:
+            # Copied: AlbumsList updates its list in place while loading
+            albums = list(albums_list.albums)
+
+            # Get ALL cached tracks for smart search across all loaded albums.
+            # Add album info to each track for navigation, in new view dicts
+            # so the cached tracks are never modified
+            tracks = []
+            album_by_id = {album.id: album for album in albums}
+            for album_id, track in cache.iter_tracks():
+                album = album_by_id.get(album_id)
+                if album is None:
+                    tracks.append(track)
+                else:
+                    tracks.append(
+                        {
+                            **track,
+                            "album_id": album_id,
+                            "album_type": album.type,
+                            "album_name": album.name,
+                        }
+                    )
 
-        # Get ALL cached tracks for smart search across all loaded albums
-        tracks = []
-        try:
-            cache = TracksCache()
-            all_cached_tracks = cache.get_all_tracks()
-
-            # Add album info to each track for navigation
-            for track in all_cached_tracks:
-                album_id = track.get("_cache_album_id")
-                # Find the album info from albums list
-                for album in albums:
-                    if album["id"] == album_id:
-                        track["album_id"] = album_id
-                        track["album_type"] = album["type"]
-                        track["album_name"] = album["name"]
-                        break
-                tracks.append(track)
-
-            log(f"  - Got {len(tracks)} tracks from cache (all loaded albums)")
-        except Exception as e:
-            log(f"  - Error getting cached tracks: {e}")
+            if self._search_modal is None:
+                self._search_modal = SearchModal(albums=albums, tracks=tracks)
+                self.install_screen(self._search_modal, name="search")
+            else:
+                self._search_modal.update_data(albums, tracks)
+            # iter_tracks may have expired entries, so read the version after
+            self._search_data_key = (albums_list.albums_version, cache.version)
 
-        # Open the search modal
-        search_modal = SearchModal(albums=albums, tracks=tracks)
-        self.push_screen(search_modal)
+        self.push_screen(self._search_modal)
 
     def action_open_cache_info(self) -> None:
         """Open the cache info modal."""
-        log("TtydalApp.action_open_cache_info() called")
-        cache_modal = CacheModal()
-        self.push_screen(cache_modal)
+        if self._cache_modal is not None and self.screen is self._cache_modal:
+            return
+        if self._cache_modal is None:
+            self._cache_modal = CacheModal()
+            self.install_screen(self._cache_modal, name="cache")
+        self.push_screen(self._cache_modal)
 
     def action_open_debug_info(self) -> None:
         """Open the debug info modal showing live playback state."""
-        log("TtydalApp.action_open_debug_info() called")
-        from ttydal.components.playlist_info_modal import PlaylistInfoModal
-
         engine = self.player
         config = self.config
 
         try:
-            tracks_list = self.query_one(TracksList)
+            tracks_list = self.tracks_list
             active_playlist = tracks_list._active_playlist
             current_idx = tracks_list.current_playing_index
             active_item_id = tracks_list._active_playlist_item_id
@@ -414,8 +429,6 @@ class TtydalApp(App):
             s = int(s)
             return f"{s // 60}:{s % 60:02d}"
 
-        import subprocess
-
         def _run(cmd: list[str]) -> str:
             try:
                 r = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
@@ -462,46 +475,34 @@ class TtydalApp(App):
         Args:
             event: Album selected event
         """
-        log(f"TtydalApp: Album selected from search - {event.album_name}")
+        log("TtydalApp: Album selected from search - %s", event.album_name)
 
         # Switch to player page if not already there
-        if self.current_page != "player":
-            self.action_show_player()
+        self.action_show_player()
 
         # Find the album in the albums list and select it
-        try:
-            player_page = self.query_one(PlayerPage)
-            albums_list = player_page.query_one(AlbumsList)
-
-            # Find the index of the album
-            for idx, album in enumerate(albums_list.albums):
-                if album["id"] == event.album_id:
-                    log(f"  - Found album at index {idx}")
-                    # Select the album in the list view
-                    list_view = albums_list.query_one("#albums-listview")
-                    list_view.index = idx
-                    # Scroll to make the selected album visible
-                    list_view.call_after_refresh(
-                        list_view.scroll_to_widget,
-                        list_view._nodes[idx],
-                        animate=False,
-                    )
-                    # Trigger the album selection to load tracks
-                    albums_list.post_message(
-                        AlbumsList.AlbumSelected(
-                            event.album_id, event.album_name, event.album_type
-                        )
-                    )
-                    # Focus the tracks list after album selection
-                    # (tracks will be loaded and this gives better UX)
-                    tracks_list = player_page.query_one(TracksList)
-                    tracks_listview = tracks_list.query_one("#tracks-listview")
-                    tracks_listview.focus()
-                    return
-
-            log(f"  - Album {event.album_id} not found in list")
-        except Exception as e:
-            log(f"  - Error selecting album: {e}")
+        albums_list = self.albums_list
+
+        # Find the index of the album
+        idx = albums_list.index_of(event.album_id)
+        if idx is None:
+            log("  - Album %s not found in list", event.album_id)
+            return
+
+        # Select the album in the list view
+        list_view = albums_list.list_view
+        list_view.index = idx
+        # Scroll to make the selected album visible
+        self._scroll_into_view(list_view, idx)
+        # Trigger the album selection to load tracks
+        albums_list.post_message(
+            AlbumsList.AlbumSelected(event.album_id, event.album_name, event.album_type)
+        )
+        # Focus the tracks list after album selection
+        # (tracks will be loaded and this gives better UX)
+        tracks_list = self.tracks_list
+        tracks_listview = tracks_list.list_view
+        tracks_listview.focus()
 
     def on_search_modal_track_selected(self, event: SearchModal.TrackSelected) -> None:
         """Handle track selection from search modal.
@@ -510,56 +511,82 @@ class TtydalApp(App):
             event: Track selected event (play=True for Space, play=False for Enter)
         """
         log(
-            f"TtydalApp: Track selected from search - {event.track_info.get('name', 'Unknown')} (play={event.play})"
+            "TtydalApp: Track selected from search - %s (play=%s)",
+            event.track_info.get("name", "Unknown"),
+            event.play,
         )
 
         # Switch to player page if not already there
-        if self.current_page != "player":
-            self.action_show_player()
-
-        try:
-            player_page = self.query_one(PlayerPage)
-            albums_list = player_page.query_one(AlbumsList)
-            tracks_list = player_page.query_one(TracksList)
-
-            # Check if we need to load a different album
-            current_album_id = tracks_list.current_item_id
-            target_album_id = event.album_id
-
-            if current_album_id != target_album_id:
-                # Need to load the album first, then navigate to track
-                log(
-                    f"  - Loading album {target_album_id} (current: {current_album_id})"
+        self.action_show_player()
+
+        albums_list = self.albums_list
+        tracks_list = self.tracks_list
+
+        # Check if we need to load a different album
+        current_album_id = tracks_list.current_item_id
+        target_album_id = event.album_id
+
+        if current_album_id != target_album_id:
+            # Need to load the album first, then navigate to track
+            log(
+                "  - Loading album %s (current: %s)", target_album_id, current_album_id
+            )
+
+            # Find and select the album
+            load_worker = None
+            idx = albums_list.index_of(target_album_id)
+            if idx is not None:
+                album = albums_list.albums[idx]
+                albums_listview = albums_list.list_view
+                albums_listview.index = idx
+
+                # Load the album tracks
+                load_worker = tracks_list.load_tracks(
+                    album.id, album.name, album.type
                 )
 
-                # Find and select the album
-                for idx, album in enumerate(albums_list.albums):
-                    if album["id"] == target_album_id:
-                        albums_listview = albums_list.query_one("#albums-listview")
-                        albums_listview.index = idx
-
-                        # Load the album tracks
-                        tracks_list.load_tracks(
-                            album["id"], album["name"], album["type"]
-                        )
-                        break
-
-                # Schedule the track selection after tracks are loaded
-                def select_track_after_load():
-                    self._select_and_maybe_play_track(
-                        tracks_list, event.track_id, event.track_info, event.play
-                    )
-
-                self.set_timer(0.5, select_track_after_load)
-            else:
-                # Album already loaded, just select/play the track
-                log("  - Album already loaded, selecting track directly")
-                self._select_and_maybe_play_track(
-                    tracks_list, event.track_id, event.track_info, event.play
-                )
+            # Select the track as soon as the tracks have loaded
+            self.run_worker(
+                self._select_track_after_load(
+                    load_worker,
+                    tracks_list,
+                    event.track_id,
+                    event.track_info,
+                    event.play,
+                ),
+                group="search-track-select",
+                exclusive=True,
+            )
+        else:
+            # Album already loaded, just select/play the track
+            self._select_and_maybe_play_track(
+                tracks_list, event.track_id, event.track_info, event.play
+            )
+
+    async def _select_track_after_load(
+        self,
+        load_worker: Worker | None,
+        tracks_list: TracksList,
+        track_id: str,
+        track_info: dict,
+        play: bool,
+    ) -> None:
+        """Wait for a tracks load to finish, then select the track.
 
-        except Exception as e:
-            log(f"  - Error handling track selection: {e}")
+        Args:
+            load_worker: Worker loading the track's album (None if not found)
+            tracks_list: The TracksList component
+            track_id: ID of the track to select
+            track_info: Track metadata
+            play: Whether to play the track
+        """
+        if load_worker is not None:
+            try:
+                await load_worker.wait()
+            except WorkerCancelled:
+                # Another album load replaced this one
+                return
+        self._select_and_maybe_play_track(tracks_list, track_id, track_info, play)
 
     def _select_and_maybe_play_track(
         self, tracks_list: TracksList, track_id: str, track_info: dict, play: bool
@@ -572,45 +599,50 @@ class TtydalApp(App):
             track_info: Track metadata
             play: Whether to play the track
         """
-        try:
-            # Find the track index
-            track_index = None
-            for idx, track in enumerate(tracks_list.tracks):
-                if track["id"] == track_id:
-                    track_index = idx
-                    break
-
-            if track_index is not None:
-                # Select the track in the list view
-                list_view = tracks_list.query_one("#tracks-listview")
-                list_view.index = track_index
-
-                # Scroll to make the selected track visible and focus the list
-                if track_index < len(list_view._nodes):
-                    list_view.call_after_refresh(
-                        list_view.scroll_to_widget,
-                        list_view._nodes[track_index],
-                        animate=False,
-                    )
-                list_view.focus()
+        # Find the track index
+        track_index = None
+        for idx, track in enumerate(tracks_list.tracks):
+            if track["id"] == track_id:
+                track_index = idx
+                break
+
+        if track_index is not None:
+            # Select the track in the list view
+            list_view = tracks_list.list_view
+            list_view.index = track_index
+
+            # Scroll to make the selected track visible and focus the list
+            self._scroll_into_view(list_view, track_index)
+            list_view.focus()
+
+            if play:
+                # Update playing state and play the track
+                tracks_list.current_playing_index = track_index
+                tracks_list._playing_item_id = tracks_list.current_item_id
+                tracks_list._update_track_indicators()
+
+                # Post the track selected message to trigger playback
+                tracks_list.post_message(
+                    TracksList.TrackSelected(track_id, track_info)
+                )
+        else:
+            log("  - Track %s not found in current tracks list", track_id)
 
-                if play:
-                    # Update playing state and play the track
-                    tracks_list.current_playing_index = track_index
-                    tracks_list._playing_item_id = tracks_list.current_item_id
-                    tracks_list._update_track_indicators()
+    @staticmethod
+    def _scroll_into_view(list_view: ListView, index: int) -> None:
+        """Scroll a list item into view unless it is already fully visible.
 
-                    # Post the track selected message to trigger playback
-                    tracks_list.post_message(
-                        TracksList.TrackSelected(track_id, track_info)
-                    )
-                    log("  - Posted TrackSelected message for playback")
-                else:
-                    log(f"  - Track selected at index {track_index} (not playing)")
-            else:
-                log(f"  - Track {track_id} not found in current tracks list")
-        except Exception as e:
-            log(f"  - Error selecting track: {e}")
+        Args:
+            list_view: The list view to scroll
+            index: Index of the item to show
+        """
+        if index >= len(list_view._nodes):
+            return
+        item = list_view._nodes[index]
+        if not list_view.can_view_entire(item):
+            list_view.call_after_refresh(
+                list_view.scroll_to_widget, item, animate=False
+            )
 
     def on_config_page_theme_changed(self, event: ConfigPage.ThemeChanged) -> None:
         """Handle theme setting change.
@@ -628,9 +660,7 @@ class TtydalApp(App):
             event: Quality changed event
         """
         # Update player bar display
-        player_page = self.query_one(PlayerPage)
-        player_bar = player_page.query_one(PlayerBar)
-        player_bar.update_quality_display(event.quality)
+        self.player_bar.update_quality_display(event.quality)
 
     def on_config_page_login_requested(self, event: ConfigPage.LoginRequested) -> None:
         """Handle login request from config page.
@@ -641,7 +671,7 @@ class TtydalApp(App):
         log("Login requested from config page")
         self.start_login_flow()
 
-    def on_config_page_clear_logs_requested(
+    async def on_config_page_clear_logs_requested(
         self, event: ConfigPage.ClearLogsRequested
     ) -> None:
         """Handle clear logs request from config page.
@@ -651,21 +681,15 @@ class TtydalApp(App):
         """
         log("Clear logs requested from config page")
         try:
-            from ttydal.dirs import log_dir
-
-            log_file = log_dir() / "debug.log"
-
-            if log_file.exists():
-                # Clear the log file by truncating it
-                with open(log_file, "w") as f:
-                    f.write("")
-                log("Debug log file cleared successfully")
-                self.notify("Debug logs cleared!", severity="information")
-            else:
-                log("Debug log file does not exist")
-                self.notify("No logs to clear", severity="warning")
-        except Exception as e:
-            log(f"Error clearing logs: {e}")
+            # Truncate off the event loop; large logs can take a while
+            await asyncio.to_thread(os.truncate, log_dir() / "debug.log", 0)
+            log("Debug log file cleared successfully")
+            self.notify("Debug logs cleared!", severity="information")
+        except FileNotFoundError:
+            log("Debug log file does not exist")
+            self.notify("No logs to clear", severity="warning")
+        except OSError as e:
+            log("Error clearing logs: %s", e)
             self.notify(f"Error clearing logs: {e}", severity="error")
 
     def on_config_page_list_striping_changed(
@@ -676,9 +700,8 @@ class TtydalApp(App):
         Args:
             event: List striping changed event
         """
-        player_page = self.query_one(PlayerPage)
-        albums_list = player_page.query_one(AlbumsList)
-        tracks_list = player_page.query_one(TracksList)
+        albums_list = self.albums_list
+        tracks_list = self.tracks_list
 
         if event.enabled:
             albums_list.remove_class("no-stripes")
@@ -690,15 +713,21 @@ class TtydalApp(App):
         status = "enabled" if event.enabled else "disabled"
         self.notify(f"List striping {status}", severity="information")
 
-    def on_unmount(self) -> None:
+    async def on_unmount(self) -> None:
         """Cleanup when application unmounts."""
         log("TtydalApp.on_unmount() called - cleaning up...")
-        try:
-            log("  - Shutting down player...")
-            self.player.shutdown()
+        log("  - Shutting down player...")
+        # mpv's terminate() joins its event thread; run it on a daemon thread
+        # and wait a bounded time so a stuck mpv can't hold up exiting
+        shutdown = threading.Thread(
+            target=self.player.shutdown, name="mpv-shutdown", daemon=True
+        )
+        shutdown.start()
+        await asyncio.to_thread(shutdown.join, _PLAYER_SHUTDOWN_TIMEOUT)
+        if shutdown.is_alive():
+            log("  - Player shutdown still running, not waiting any longer")
+        else:
             log("  - Player shutdown complete")
-        except Exception as e:
-            log(f"  - Error during player shutdown: {e}")
         log("TtydalApp.on_unmount() completed")
 
     async def action_quit(self) -> None:
@@ -710,14 +739,14 @@ class TtydalApp(App):
             self.workers.cancel_all()
             log("  - Workers cancelled")
         except Exception as e:
-            log(f"  - Error cancelling workers: {e}")
+            log("  - Error cancelling workers: %s", e)
 
         try:
-            player_page = self.query_one(PlayerPage)
-            if hasattr(player_page, "mpris_service"):
+            player_page = self.player_page
+            if player_page.mpris_service is not None:
                 player_page.mpris_service.shutdown()
         except Exception as e:
-            log(f"  - Error shutting down MPRIS service: {e}")
+            log("  - Error shutting down MPRIS service: %s", e)
 
         log("  - Calling self.exit()...")
         self.exit()
@@ -1,27 +1,91 @@
 """Albums list component for browsing user albums and playlists.
 
-Note: We don't cache the albums list because:
-1. Users rarely reload it after initial load
-2. It's a small dataset that loads quickly
-3. Changes to favorites/playlists should reflect immediately
+The list is cached on disk (see AlbumsCache) so it shows up instantly on
+startup. A cached list older than the cache TTL is shown as-is and then
+refreshed from Tidal in the background; refreshing with the refresh key
+always refetches.
 """
 
+import asyncio
+import functools
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import asdict, dataclass
+from typing import Any
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container
 from textual.widgets import ListItem, ListView, Label
 from textual.message import Message
+from textual.timer import Timer
+from textual.worker import Worker
 
 from ttydal.services.tidal_client import TidalClient
 from ttydal.services import AlbumsService, TracksService, TidalServiceError
+from ttydal.services.albums_cache import AlbumsCache
 from ttydal.services.tracks_cache import TracksCache
+from ttydal.config import ConfigManager
 from ttydal.logger import log
 from ttydal.components.cover_art_item import CoverArtItem
+from ttydal.components.cover_art_modal import CoverArtModal
 from ttydal.keybindings import get_key
 
 _k = lambda action: get_key("albums_list", action)
 _nav = lambda action: get_key("navigation", action)
 
+# Max concurrent Tidal requests while preloading tracks
+_PRELOAD_CONCURRENCY = 8
+
+# Rows mounted per step when filling the list (more than a screenful)
+_MOUNT_CHUNK = 50
+
+# Seconds to wait for more playing changes before repainting the indicator
+_INDICATOR_DELAY = 0.08
+
+
+@functools.lru_cache(maxsize=2048)
+def _format_suffix(name: str, count: int | str) -> str:
+    """Format the "name (count tracks)" part of an albums list row.
+
+    Memoized so reloads (startup from cache, then the background refresh)
+    reuse the strings of unchanged rows.
+    """
+    return f"{name} ({count} tracks)"
+
+
+@dataclass(slots=True)
+class AlbumEntry:
+    """An album, playlist or My Tracks row in the albums list."""
+
+    id: str
+    name: str
+    type: str  # "album", "playlist", or "favorites"
+    count: int | str  # "?" when Tidal doesn't report it
+    cover_url: str | None = None
+
+
+class AlbumRow(ListItem):
+    """A row of the albums list, holding on to its entry and CoverArtItem.
+
+    Keeping the references lets indicator updates skip a DOM query per row,
+    and lets a row be resolved to its album without going through indices.
+    """
+
+    def __init__(
+        self, album: AlbumEntry, suffix: str, cover_art_item: CoverArtItem
+    ) -> None:
+        """Initialize the row.
+
+        Args:
+            album: The album/playlist shown in the row
+            suffix: The row's "name (count tracks)" text
+            cover_art_item: The row's cover art and text
+        """
+        super().__init__(cover_art_item)
+        self.album = album
+        self.suffix = suffix
+        self.cover_art_item = cover_art_item
+
 
 class AlbumsList(Container):
     """Albums list widget for browsing user albums."""
@@ -94,50 +158,122 @@ class AlbumsList(Container):
         tidal_client = TidalClient()
         self.albums_service = AlbumsService(tidal_client)
         self.tracks_service = TracksService(tidal_client)
-        self.albums = []
+        self.albums: list[AlbumEntry] = []
+        # Bumped whenever self.albums changes, so consumers can cache on it
+        self.albums_version = 0
+        # Last list that loaded in full, shown again if a later load fails
+        self._complete_albums: list[AlbumEntry] = []
+        # Album/playlist ID -> position in self.albums, rebuilt on every load
+        self._album_index_by_id: dict[str, int] = {}
+        # Number of _mount_rows calls still inserting rows
+        self._mounts_in_progress = 0
         self.current_playing_item_id = None
+        # Item whose row currently shows the '>' indicator
+        self._painted_playing_id: str | None = None
+        self._indicator_timer: Timer | None = None
         self._is_initial_load = True
         self._saved_selection_id = None  # For restoring selection after refresh
-        self._preload_in_progress = False
+        # Bumped by every load so superseded loads can drop their results
+        self._load_generation = 0
+        self._preload_worker: Worker | None = None
         self._trigger_preload_after_refresh = False
+        # Child widgets, kept so methods don't have to query for them
+        self._header = Label("(a)lbums & playlists")
+        self._list_view = ListView(id="albums-listview")
 
     def compose(self) -> ComposeResult:
         """Compose the albums list UI."""
-        yield Label("(a)lbums & playlists")
-        yield ListView(id="albums-listview")
+        yield self._header
+        yield self._list_view
 
     def on_mount(self) -> None:
-        """Load albums when mounted and auto-select My Tracks."""
-        from ttydal.config import ConfigManager
-
+        """Apply list striping (the app calls initial_load() once logged in)."""
         if not ConfigManager().list_striping:
             self.add_class("no-stripes")
 
-        # Delay loading to ensure session is ready
-        log("AlbumsList.on_mount() called - scheduling delayed load")
-        self.set_timer(0.5, self.delayed_load)
+    def on_show(self) -> None:
+        """Catch up on playing indicator changes made while hidden."""
+        self._repaint_playing_indicator()
 
-    def delayed_load(self) -> None:
-        """Load albums after a delay to ensure session is ready."""
-        log("AlbumsList.delayed_load() called")
+    def initial_load(self) -> None:
+        """Load albums for the first time (the session must be ready)."""
+        log("AlbumsList.initial_load() called")
         # This is the initial load, so auto-select My Tracks afterwards
         self._is_initial_load = True
-        # Add loading class for visual feedback
-        self.add_class("loading")
+        self._load_generation += 1
         # Run loading in a worker - exclusive=True prevents race conditions
-        self.run_worker(self._load_albums_async(), exclusive=True)
+        self.run_worker(
+            self._initial_load_async(self._load_generation), exclusive=True
+        )
+
+    async def _initial_load_async(self, generation: int) -> None:
+        """Show the cached albums list straight away, then refresh it if stale.
+
+        Args:
+            generation: Value of self._load_generation this load belongs to
+        """
+        cached = await asyncio.to_thread(self._load_from_cache)
+        if self._is_superseded(generation):
+            return
+        if cached is None:
+            # Add loading class for visual feedback
+            self.add_class("loading")
+            await self._load_albums_async(generation)
+            return
+
+        albums, fresh = cached
+        if not await self._show_albums(albums, generation):
+            return
+        self._after_albums_shown()
+        if not fresh:
+            await self._revalidate_albums(generation)
+
+    @staticmethod
+    def _load_from_cache() -> tuple[list[AlbumEntry], bool] | None:
+        """Read the albums list from the disk cache.
+
+        Returns:
+            (entries, whether they are still fresh), or None if nothing
+            usable is cached
+        """
+        user_id = TidalClient().user_id
+        if user_id is None:
+            return None
+        cache = AlbumsCache()
+        cached = cache.get(user_id)
+        if cached is None:
+            return None
+        albums, age = cached
+        try:
+            entries = [AlbumEntry(**album) for album in albums]
+        except TypeError as e:
+            log(f"AlbumsList: Ignoring cached albums in an old format: {e}")
+            return None
+        return entries, cache.is_fresh(age)
+
+    @staticmethod
+    def _save_to_cache(albums: list[AlbumEntry]) -> None:
+        """Write the albums list to the disk cache.
+
+        Args:
+            albums: Album/playlist entries in display order
+        """
+        user_id = TidalClient().user_id
+        if user_id is None:
+            return
+        AlbumsCache().set([asdict(album) for album in albums], user_id)
 
     def auto_select_my_tracks(self) -> None:
         """Auto-select My Tracks on startup and focus the list."""
         log("AlbumsList: Auto-selecting My Tracks")
-        list_view = self.query_one("#albums-listview", ListView)
+        list_view = self._list_view
         if len(self.albums) > 0:
             list_view.index = 0
             list_view.focus()
             # Trigger selection event
             self.post_message(
                 self.AlbumSelected(
-                    self.albums[0]["id"], self.albums[0]["name"], self.albums[0]["type"]
+                    self.albums[0].id, self.albums[0].name, self.albums[0].type
                 )
             )
             log("  - My Tracks auto-selected and focused")
@@ -148,63 +284,102 @@ class AlbumsList(Container):
         if self._saved_selection_id is None:
             return
 
-        list_view = self.query_one("#albums-listview", ListView)
+        list_view = self._list_view
         # Find the index of the saved selection
-        for idx, album in enumerate(self.albums):
-            if album["id"] == self._saved_selection_id:
-                # reset index to force highlight to be rebuild on the ui
-                list_view.index = None
-                list_view.index = idx
-                log(f"  - Selection restored to index {idx}")
-                return
-        log("  - Could not find saved selection, keeping current position")
+        idx = self.index_of(self._saved_selection_id)
+        if idx is None:
+            log("  - Could not find saved selection, keeping current position")
+            return
+        # reset index to force highlight to be rebuild on the ui
+        list_view.index = None
+        list_view.index = idx
+        log(f"  - Selection restored to index {idx}")
+
+    @property
+    def list_view(self) -> ListView:
+        """Get the albums ListView."""
+        return self._list_view
+
+    def index_of(self, item_id: str) -> int | None:
+        """Get the position of an album/playlist in the list.
+
+        Args:
+            item_id: The album/playlist ID
+
+        Returns:
+            Index into self.albums, or None if not loaded
+        """
+        return self._album_index_by_id.get(item_id)
 
     def _start_preload(self) -> None:
         """Start background preloading of all tracks."""
-        if self._preload_in_progress:
+        if self._preload_worker is not None and not self._preload_worker.is_finished:
             return
-        self._preload_in_progress = True
         log("AlbumsList: Starting background preload of all tracks")
-        self.run_worker(self._preload_all_tracks_async(), exclusive=False)
+        self._preload_worker = self.run_worker(
+            self._preload_all_tracks_async(), group="preload"
+        )
+
+    async def _fetch_tracks(
+        self, album: AlbumEntry, semaphore: asyncio.Semaphore
+    ) -> list[dict]:
+        """Fetch the tracks of one album/playlist for preloading.
+
+        Args:
+            album: Album/playlist entry from self.albums
+            semaphore: Caps how many Tidal requests run at once
+
+        Returns:
+            List of track dictionaries
+        """
+        tracks_service = self.tracks_service
+        item_type = album.type
+        async with semaphore:
+            if item_type == "favorites":
+                return await tracks_service.get_favorites_tracks()
+            if item_type == "playlist":
+                return await tracks_service.get_playlist_tracks(album.id)
+            return await tracks_service.get_album_tracks(album.id)
 
     async def _preload_all_tracks_async(self) -> None:
         """Background worker to preload tracks for all albums into cache."""
         cache = TracksCache()
-        total_loaded = 0
         albums_to_load = list(
             self.albums
         )  # Copy to avoid modification during iteration
 
         log(f"AlbumsList: Preloading tracks for {len(albums_to_load)} albums")
 
-        for album in albums_to_load:
-            item_id = album["id"]
-            item_type = album["type"]
+        # Skip the ones already cached
+        needed = cache.filter_uncached(album.id for album in albums_to_load)
+        uncached = [album for album in albums_to_load if album.id in needed]
+        log(f"  - {len(albums_to_load) - len(uncached)} already cached, skipping")
+
+        # Fetch concurrently so the wait is bounded by the slowest requests,
+        # not the sum of all of them
+        semaphore = asyncio.Semaphore(_PRELOAD_CONCURRENCY)
+        results = await asyncio.gather(
+            *(self._fetch_tracks(album, semaphore) for album in uncached),
+            return_exceptions=True,
+        )
 
-            # Skip if already cached
-            if cache.get(item_id) is not None:
-                log(f"  - {album['name']}: already cached, skipping")
+        cache_set = cache.set
+        for album, tracks in zip(uncached, results):
+            if isinstance(tracks, BaseException):
+                log("  - %s: error loading tracks: %s", album.name, tracks)
                 continue
+            cache_set(album.id, tracks)
+            log("  - %s: cached %d tracks", album.name, len(tracks))
 
-            try:
-                if item_type == "favorites":
-                    tracks = await self.tracks_service.get_favorites_tracks()
-                elif item_type == "playlist":
-                    tracks = await self.tracks_service.get_playlist_tracks(item_id)
-                else:  # album
-                    tracks = await self.tracks_service.get_album_tracks(item_id)
-
-                cache.set(item_id, tracks)
-                total_loaded += len(tracks)
-                log(f"  - {album['name']}: cached {len(tracks)} tracks")
-            except Exception as e:
-                log(f"  - {album['name']}: error loading tracks: {e}")
-
-        self._preload_in_progress = False
         stats = cache.get_stats()
         log(
-            f"AlbumsList: Preload complete - {stats['tracks_count']} tracks "
-            f"from {stats['albums_count']} albums"
+            "AlbumsList: Preload complete - %d tracks from %d albums "
+            "(cache hits: %d, misses: %d, evictions: %d)",
+            stats["tracks_count"],
+            stats["albums_count"],
+            stats["hits"],
+            stats["misses"],
+            stats["evictions"],
         )
 
     def load_albums(self) -> None:
@@ -213,132 +388,419 @@ class AlbumsList(Container):
         # This is a refresh, not initial load - preserve current selection
         self._is_initial_load = False
         # Save the current selection to restore after refresh
-        list_view = self.query_one("#albums-listview", ListView)
+        list_view = self._list_view
         current_index = list_view.index
         if current_index is not None and current_index < len(self.albums):
-            self._saved_selection_id = self.albums[current_index]["id"]
+            self._saved_selection_id = self.albums[current_index].id
             log(f"  - Saved current selection: {self._saved_selection_id}")
         else:
             self._saved_selection_id = None
         # Add loading class for visual feedback
         self.add_class("loading")
         # Show loading in header
-        header = self.query_one(Label)
-        header.update("(a)lbums & playlists (loading...)")
+        self._header.update("(a)lbums & playlists (loading...)")
         # Clear list immediately (synchronously) to prevent display issues
         list_view.remove_children()
-        self.albums = []
+        self._set_albums([])
         log("  - Cleared albums list synchronously using remove_children()")
+        self._load_generation += 1
         # Run loading in a worker - exclusive=True prevents race conditions
-        self.run_worker(self._load_albums_async(), exclusive=True)
+        self.run_worker(
+            self._load_albums_async(self._load_generation), exclusive=True
+        )
 
-    async def _load_albums_async(self) -> None:
-        """Async worker to load albums without blocking UI."""
-        log("AlbumsList._load_albums_async() called")
+    def _is_superseded(self, generation: int) -> bool:
+        """Check whether a newer load has started since the given one.
 
-        try:
-            # List already cleared synchronously before worker started
-            # Add "My Tracks" as first item - get actual favorite track count
-            list_view = self.query_one("#albums-listview", ListView)
-            log("  - Getting favorite tracks count...")
-            favorites_info = await self.albums_service.get_favorites_info()
-            fav_count = favorites_info["count"]
-            log(f"  - Found {fav_count} favorite tracks")
-            list_view.append(
-                ListItem(
-                    CoverArtItem(
-                        f"My Tracks ({fav_count} tracks)",
-                        cover_url=None,  # Favorites has no cover
-                    )
-                )
-            )
-            self.albums = [
-                {
-                    "id": "favorites",
-                    "name": "My Tracks",
-                    "type": "favorites",
-                    "count": fav_count,
-                    "cover_url": None,
-                }
-            ]
-
-            # Load user playlists
-            log("  - Loading playlists...")
-            user_playlists = await self.albums_service.get_user_playlists()
-            for playlist in user_playlists:
-                playlist_name = playlist["name"]
-                # Get track count - check for None explicitly to handle 0 correctly
-                track_count = playlist.get("count")
-                if track_count is None:
-                    track_count = "?"
-                cover_url = playlist.get("cover_url")
-                display_name = f"{playlist_name} ({track_count} tracks)"
-                list_view.append(
-                    ListItem(CoverArtItem(display_name, cover_url=cover_url))
-                )
-                self.albums.append(
-                    {
-                        "id": str(playlist["id"]),
-                        "name": playlist_name,
-                        "type": "playlist",
-                        "count": track_count,
-                        "cover_url": cover_url,
-                    }
-                )
-            log(f"  - Loaded {len(user_playlists)} playlists")
-
-            # Load user albums
-            log("  - Loading albums...")
-            user_albums = await self.albums_service.get_user_albums()
-            for album in user_albums:
-                album_name = album["name"]
-                # Get track count - check for None explicitly to handle 0 correctly
-                track_count = album.get("count")
-                if track_count is None:
-                    track_count = "?"
-                cover_url = album.get("cover_url")
-                display_name = f"{album_name} ({track_count} tracks)"
-                list_view.append(
-                    ListItem(CoverArtItem(display_name, cover_url=cover_url))
-                )
-                self.albums.append(
-                    {
-                        "id": str(album["id"]),
-                        "name": album_name,
-                        "type": "album",
-                        "count": track_count,
-                        "cover_url": cover_url,
-                    }
-                )
-            log(f"  - Loaded {len(user_albums)} albums")
-            log(f"  - Total items in list: {len(self.albums)}")
+        Cancelling the old worker stops it at its next await, but a mount
+        can complete first. Loads check this after every await so they never
+        touch the list once a newer load owns it.
 
-            # Update header to remove loading text
-            header = self.query_one(Label)
-            header.update("(a)lbums & playlists")
+        Args:
+            generation: Value of self._load_generation the load belongs to
 
-            # Update visual indicators (in case we're reloading while something is playing)
-            self._update_album_indicators()
+        Returns:
+            True if the load's results should be dropped
+        """
+        if generation != self._load_generation:
+            log(f"AlbumsList: Dropping results of superseded load {generation}")
+            return True
+        return False
 
-            # Auto-select "My Tracks" only on initial load, restore selection on refresh
-            if self._is_initial_load:
-                self.set_timer(0.1, self.auto_select_my_tracks)
-                # Start background preloading of all tracks for cache
-                self.set_timer(0.5, self._start_preload)
-            else:
-                self.set_timer(0.1, self._restore_selection)
-                # Re-preload all tracks after refresh if requested
-                if self._trigger_preload_after_refresh:
-                    self._trigger_preload_after_refresh = False
-                    self.set_timer(0.5, self._start_preload)
+    async def _load_albums_async(self, generation: int) -> None:
+        """Async worker to load albums without blocking UI.
+
+        Args:
+            generation: Value of self._load_generation this load belongs to
+        """
+        log("AlbumsList._load_albums_async() called")
+
+        try:
+            albums = await self._stream_albums(generation)
+            if albums is None:
+                return
+            self._complete_albums = list(albums)
+            await asyncio.to_thread(self._save_to_cache, albums)
+            if self._is_superseded(generation):
+                return
+            log(f"  - Total items in list: {len(albums)}")
+            # Update header to remove loading text
+            self._header.update("(a)lbums & playlists")
+            self._after_albums_shown()
         except TidalServiceError as e:
             log(f"AlbumsList: Service error loading albums: {e}")
-            header = self.query_one(Label)
-            header.update("(a)lbums & playlists (error)")
             self.app.notify(e.user_message, severity="error", timeout=5)
+            if self._is_superseded(generation):
+                return
+            await self._recover_from_failed_load(generation)
         finally:
-            # Remove loading class when done (success or error)
-            self.remove_class("loading")
+            # Remove loading class when done (success or error), unless a
+            # newer load is showing it
+            if generation == self._load_generation:
+                self.remove_class("loading")
+
+    async def _recover_from_failed_load(self, generation: int) -> None:
+        """Deal with sections streamed in before a load failed.
+
+        Puts the last complete list back if there is one. Otherwise the rows
+        that did arrive stay, marked as partial, and the selection and
+        preload that follow a finished load are skipped.
+
+        Args:
+            generation: Value of self._load_generation this load belongs to
+        """
+        previous = self._complete_albums
+        if not previous:
+            log("  - No complete list to fall back to, keeping partial list")
+            self._header.update("(a)lbums & playlists (error, partial list)")
+            return
+        log(f"  - Restoring the previous list ({len(previous)} items)")
+        if not await self._show_albums(previous, generation):
+            return
+        self._header.update("(a)lbums & playlists (error)")
+        self._after_albums_shown()
+
+    async def _revalidate_albums(self, generation: int) -> None:
+        """Refresh a stale cached albums list from Tidal in the background.
+
+        Args:
+            generation: Value of self._load_generation this load belongs to
+        """
+        log("AlbumsList: Cached albums list is stale, refreshing")
+        try:
+            albums = await self._fetch_albums()
+        except TidalServiceError as e:
+            # Keep showing the cached list, it's better than nothing
+            log(f"AlbumsList: Service error refreshing albums: {e}")
+            return
+        if self._is_superseded(generation):
+            return
+        await asyncio.to_thread(self._save_to_cache, albums)
+        if self._is_superseded(generation):
+            return
+        if albums == self.albums:
+            log("  - Albums list unchanged")
+            return
+
+        # Keep the user's selection across the swap
+        list_view = self._list_view
+        current_index = list_view.index
+        if current_index is not None and current_index < len(self.albums):
+            self._saved_selection_id = self.albums[current_index].id
+        else:
+            self._saved_selection_id = None
+        self._is_initial_load = False
+        if await self._show_albums(albums, generation):
+            self._after_albums_shown()
+
+    def _section_fetches(self) -> list[Coroutine[Any, Any, list[AlbumEntry]]]:
+        """Get the requests for each section of the list, in display order.
+
+        The requests are independent, so callers run them concurrently.
+
+        Returns:
+            Coroutines fetching My Tracks, the playlists and the albums
+        """
+        return [
+            self._fetch_favorites_entry(),
+            self._fetch_section(self.albums_service.get_user_playlists, "playlist"),
+            self._fetch_section(self.albums_service.get_user_albums, "album"),
+        ]
+
+    async def _fetch_favorites_entry(self) -> list[AlbumEntry]:
+        """Fetch the My Tracks entry with its actual favorite track count.
+
+        Returns:
+            A one-item list with the My Tracks entry
+        """
+        favorites_info = await self.albums_service.get_favorites_info()
+        fav_count = favorites_info["count"]
+        log(f"  - Found {fav_count} favorite tracks")
+        return [
+            AlbumEntry(
+                id="favorites",
+                name="My Tracks",
+                type="favorites",
+                count=fav_count,
+                cover_url=None,  # Favorites has no cover
+            )
+        ]
+
+    async def _fetch_section(
+        self,
+        fetch: Callable[[], Awaitable[list[dict]]],
+        item_type: str,
+    ) -> list[AlbumEntry]:
+        """Fetch the user's playlists or albums as list entries.
+
+        Args:
+            fetch: AlbumsService method returning the items
+            item_type: 'playlist' or 'album'
+
+        Returns:
+            Entries for self.albums
+        """
+        items = await fetch()
+        log(f"  - Loaded {len(items)} {item_type}s")
+        return self._album_entries(items, item_type)
+
+    async def _fetch_albums(self) -> list[AlbumEntry]:
+        """Fetch My Tracks, playlists and albums from Tidal.
+
+        Returns:
+            Album/playlist entries in display order, My Tracks first
+
+        Raises:
+            TidalServiceError: If any of the requests fails
+        """
+        log("  - Getting favorite tracks count, playlists and albums...")
+        sections = await asyncio.gather(*self._section_fetches())
+        return [album for section in sections for album in section]
+
+    async def _stream_albums(self, generation: int) -> list[AlbumEntry] | None:
+        """Fetch the albums list, showing each section as soon as it arrives.
+
+        The first rows appear after the fastest request instead of the
+        slowest. Sections still end up in display order: one that arrives
+        early is inserted after the earlier sections as they come in.
+
+        Args:
+            generation: Value of self._load_generation this load belongs to
+
+        Returns:
+            Album/playlist entries in display order, My Tracks first, or
+            None if a newer load took over
+
+        Raises:
+            TidalServiceError: If any of the requests fails
+        """
+        log("  - Getting favorite tracks count, playlists and albums...")
+        list_view = self._list_view
+        await list_view.clear()
+        if self._is_superseded(generation):
+            return None
+        self._set_albums([])
+        self._painted_playing_id = self.current_playing_item_id
+
+        tasks = [asyncio.create_task(fetch) for fetch in self._section_fetches()]
+        sections: list[list[AlbumEntry]] = [[] for _ in tasks]
+        try:
+            async for task in asyncio.as_completed(tasks):
+                entries = await task
+                if self._is_superseded(generation):
+                    return None
+                position = tasks.index(task)
+                items = self._build_rows(entries, self._painted_playing_id)
+                index = sum(len(section) for section in sections[:position])
+                if not await self._mount_rows(index, items, generation):
+                    return None
+                sections[position] = entries
+                # Rows are on screen, so drop the loading hatch
+                self.remove_class("loading")
+                # Catch up if playback moved on while the rows were being mounted
+                self._repaint_playing_indicator()
+        finally:
+            # Stop the remaining requests if one of them failed
+            for task in tasks:
+                task.cancel()
+        return self.albums
+
+    def _build_rows(
+        self, albums: list[AlbumEntry], playing_id: str | None
+    ) -> list[AlbumRow]:
+        """Build list rows for the given albums without mounting them.
+
+        Args:
+            albums: Album/playlist entries in display order
+            playing_id: ID of the album/playlist to mark as playing
+
+        Returns:
+            The rows, in the same order
+        """
+        items = []
+        for album in albums:
+            suffix = _format_suffix(album.name, album.count)
+            cover_art_item = CoverArtItem(
+                self._row_text(suffix, album.id == playing_id),
+                cover_url=album.cover_url,
+            )
+            items.append(AlbumRow(album, suffix, cover_art_item))
+        return items
+
+    async def _mount_rows(
+        self, index: int, items: list[AlbumRow], generation: int
+    ) -> bool:
+        """Insert rows into the list a chunk at a time.
+
+        The first chunk fills the visible part of the list, so it paints
+        straight away. The rest follow chunk by chunk, and input and
+        rendering get a turn in between, so a large library doesn't stall
+        the UI on one big mount.
+
+        self.albums and the index map are updated along with each chunk, so
+        selections made in between resolve to the right album. Indicator
+        repaints wait until the last chunk is in (see
+        _repaint_playing_indicator): rows not mounted yet still carry the
+        indicator they were built with.
+
+        Args:
+            index: Position to insert the first row at
+            items: Rows to insert, in display order
+            generation: Value of self._load_generation the load belongs to
+
+        Returns:
+            False if a newer load took over part way through
+        """
+        self._mounts_in_progress += 1
+        try:
+            for start in range(0, len(items), _MOUNT_CHUNK):
+                chunk = items[start : start + _MOUNT_CHUNK]
+                position = index + start
+                # Paint each chunk in one go, not as its rows get laid out
+                with self.app.batch_update():
+                    # insert() adds the rows to the list straight away, so
+                    # record their entries before yielding to anything else
+                    await_insert = self._list_view.insert(position, chunk)
+                    self._insert_albums(position, [row.album for row in chunk])
+                    await await_insert
+                if self._is_superseded(generation):
+                    return False
+        finally:
+            self._mounts_in_progress -= 1
+        return True
+
+    def _insert_albums(self, position: int, albums: list[AlbumEntry]) -> None:
+        """Record entries for rows just inserted into the list.
+
+        Only the index map entries at or after position need updating.
+
+        Args:
+            position: Index the first of the rows was inserted at
+            albums: Entries of the inserted rows, in display order
+        """
+        entries = self.albums
+        entries[position:position] = albums
+        self.albums_version += 1
+        index_by_id = self._album_index_by_id
+        for idx in range(position, len(entries)):
+            index_by_id[entries[idx].id] = idx
+
+    def _set_albums(self, albums: list[AlbumEntry]) -> None:
+        """Record the entries matching the rows now in the list.
+
+        Args:
+            albums: Album/playlist entries in display order
+        """
+        self.albums = albums
+        self.albums_version += 1
+        self._album_index_by_id = {
+            album.id: idx for idx, album in enumerate(albums)
+        }
+
+    @staticmethod
+    def _album_entries(items: list[dict], item_type: str) -> list[AlbumEntry]:
+        """Turn playlists or albums from AlbumsService into list entries.
+
+        Args:
+            items: Playlist or album dictionaries (AlbumDict)
+            item_type: 'playlist' or 'album'
+
+        Returns:
+            Entries for self.albums
+        """
+        return [
+            AlbumEntry(
+                id=str(item["id"]),
+                name=item["name"],
+                type=item_type,
+                # Check for None explicitly to handle 0 correctly
+                count="?" if item.get("count") is None else item["count"],
+                cover_url=item.get("cover_url"),
+            )
+            for item in items
+        ]
+
+    async def _show_albums(self, albums: list[AlbumEntry], generation: int) -> bool:
+        """Replace the list contents with the given albums.
+
+        Args:
+            albums: Album/playlist entries in display order
+            generation: Value of self._load_generation this load belongs to
+
+        Returns:
+            False if a newer load took over and the list wasn't updated
+        """
+        list_view = self._list_view
+        await list_view.clear()
+        if self._is_superseded(generation):
+            return False
+        self._set_albums([])
+        # Build every row first, with its playing indicator (in case we're
+        # reloading while something is playing), then mount them in chunks
+        playing_id = self.current_playing_item_id
+        items = self._build_rows(albums, playing_id)
+        if not await self._mount_rows(0, items, generation):
+            return False
+        # Catch up if playback moved on while the rows were being mounted
+        self._painted_playing_id = playing_id
+        self._repaint_playing_indicator()
+        self._complete_albums = list(albums)
+        log(f"  - Total items in list: {len(self.albums)}")
+
+        # Update header to remove loading text
+        self._header.update("(a)lbums & playlists")
+        return True
+
+    @staticmethod
+    def _row_text(suffix: str, playing: bool) -> str:
+        """Format the text of an albums list row.
+
+        Args:
+            suffix: The row's "name (count tracks)" text
+            playing: Whether it's the currently playing album/playlist
+
+        Returns:
+            Row text, with a '>' prefix if playing (same for all types)
+        """
+        return ("> " if playing else "  ") + " " + suffix
+
+    def _after_albums_shown(self) -> None:
+        """Select an item and start preloading once the list is populated.
+
+        The rows have finished mounting by the time this runs, so the
+        selection is applied straight away.
+        """
+        # Auto-select "My Tracks" only on initial load, restore selection on refresh
+        if self._is_initial_load:
+            self.auto_select_my_tracks()
+            # Start background preloading of all tracks for cache
+            self.set_timer(0.5, self._start_preload)
+        else:
+            self._restore_selection()
+            # Re-preload all tracks after refresh if requested
+            if self._trigger_preload_after_refresh:
+                self._trigger_preload_after_refresh = False
+                self.set_timer(0.5, self._start_preload)
 
     def set_playing_item(self, item_id: str) -> None:
         """Mark an album/playlist as currently playing.
@@ -347,40 +809,58 @@ class AlbumsList(Container):
             item_id: The ID of the album/playlist that's currently playing
         """
         log(f"AlbumsList.set_playing_item({item_id}) called")
+        # Next track in the same album/playlist: the indicator stays put
+        if item_id == self.current_playing_item_id:
+            return
         self.current_playing_item_id = item_id
-        self._update_album_indicators()
+        # Coalesce bursts (e.g. skipping through tracks) into one repaint
+        if self._indicator_timer is None:
+            self._indicator_timer = self.set_timer(
+                _INDICATOR_DELAY, self._flush_playing_indicator
+            )
 
-    def _update_album_indicators(self) -> None:
-        """Update album list to show '>' indicator for currently playing album/playlist."""
-        try:
-            list_view = self.query_one("#albums-listview", ListView)
-            for idx, list_item in enumerate(list_view.children):
-                if idx < len(self.albums):
-                    item = self.albums[idx]
-                    item_name = item["name"]
-                    item_count = item["count"]
-
-                    # Add ">" prefix if this is the currently playing item
-                    prefix = (
-                        "> " if item["id"] == self.current_playing_item_id else "  "
-                    )
-
-                    # Format display (same for all types)
-                    display_name = f"{prefix} {item_name} ({item_count} tracks)"
-
-                    # Update the CoverArtItem text
-                    try:
-                        cover_art_item = list_item.query_one(CoverArtItem)
-                        cover_art_item.update_text(display_name)
-                    except Exception:
-                        # Fallback to Label for backwards compatibility
-                        try:
-                            label = list_item.query_one(Label)
-                            label.update(display_name)
-                        except Exception:
-                            pass
-        except Exception as e:
-            log(f"  - Error updating album indicators: {e}")
+    def _flush_playing_indicator(self) -> None:
+        """Repaint the playing indicator once a burst of changes settles."""
+        self._indicator_timer = None
+        # While another tab is showing, leave it to on_show
+        if self.is_on_screen:
+            self._repaint_playing_indicator()
+
+    def _repaint_playing_indicator(self) -> None:
+        """Move the '>' indicator to the current playing item, if it moved."""
+        if self._mounts_in_progress:
+            # The load repaints once its rows are all in
+            return
+        painted_id = self._painted_playing_id
+        playing_id = self.current_playing_item_id
+        if painted_id != playing_id:
+            self._painted_playing_id = playing_id
+            self._update_album_indicators(painted_id, playing_id)
+
+    def _update_album_indicators(self, *item_ids: str | None) -> None:
+        """Update the '>' indicator on the rows of the given albums/playlists.
+
+        Only the rows whose playing state changed need repainting.
+
+        Args:
+            item_ids: IDs of the albums/playlists to re-render
+        """
+        rows = self._list_view.children
+        for item_id in item_ids:
+            idx = self.index_of(item_id)
+            if idx is not None and idx < len(rows):
+                self._render_row(rows[idx])
+
+    def _render_row(self, row: AlbumRow) -> None:
+        """Rewrite one row's text with the current playing indicator.
+
+        Args:
+            row: The row to re-render
+        """
+        display_name = self._row_text(
+            row.suffix, row.album.id == self.current_playing_item_id
+        )
+        row.cover_art_item.update_text(display_name)
 
     def action_refresh_albums(self) -> None:
         """Refresh the albums and playlists list (r key action).
@@ -388,22 +868,26 @@ class AlbumsList(Container):
         This clears the tracks cache, reloads albums, and re-preloads all tracks.
         """
         log("AlbumsList: Refresh albums action triggered")
+        # Stop a running preload, its results would land in the cleared cache
+        if self._preload_worker is not None:
+            self._preload_worker.cancel()
         # Clear the entire tracks cache when refreshing albums
         TracksCache().clear()
         log("  - Cleared tracks cache")
-        # Reset preload flag so it will run again after albums load
-        self._preload_in_progress = False
+        AlbumsCache().clear()
+        _format_suffix.cache_clear()
+        # Preload again once the albums have reloaded
         self._trigger_preload_after_refresh = True
         self.load_albums()
 
     def action_cursor_down(self) -> None:
         """Move cursor down in the list."""
-        list_view = self.query_one("#albums-listview", ListView)
+        list_view = self._list_view
         list_view.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up in the list."""
-        list_view = self.query_one("#albums-listview", ListView)
+        list_view = self._list_view
         list_view.action_cursor_up()
 
     def action_focus_tracks(self) -> None:
@@ -412,22 +896,20 @@ class AlbumsList(Container):
 
         try:
             tracks_list = self.app.query_one(TracksList)
-            list_view = tracks_list.query_one("#tracks-listview")
+            list_view = tracks_list.list_view
             list_view.focus()
         except Exception:
             pass
 
     def action_show_art(self) -> None:
         """Open cover art modal for the currently highlighted album/playlist."""
-        list_view = self.query_one("#albums-listview", ListView)
-        index = list_view.index
-        if index is None or index >= len(self.albums):
+        row = self._list_view.highlighted_child
+        if not isinstance(row, AlbumRow):
             return
-        cover_url = self.albums[index].get("cover_url")
+        cover_url = row.album.cover_url
         if not cover_url:
             self.app.notify("No cover art available", timeout=2)
             return
-        from ttydal.components.cover_art_modal import CoverArtModal
         self.app.push_screen(CoverArtModal(cover_url))
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
@@ -437,12 +919,11 @@ class AlbumsList(Container):
             event: The selection event
         """
         if event.list_view.id == "albums-listview":
-            index = event.list_view.index
-            if index is not None and index < len(self.albums):
-                item = self.albums[index]
+            if isinstance(event.item, AlbumRow):
+                item = event.item.album
                 log(
-                    f"AlbumsList: Item selected - {item['name']} (type: {item['type']})"
+                    f"AlbumsList: Item selected - {item.name} (type: {item.type})"
                 )
                 self.post_message(
-                    self.AlbumSelected(item["id"], item["name"], item["type"])
+                    self.AlbumSelected(item.id, item.name, item.type)
                 )
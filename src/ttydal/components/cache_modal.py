@@ -1,8 +1,11 @@
 """Cache info modal showing cache statistics with visual indicators."""
 
+import asyncio
+import functools
+
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, Horizontal
+from textual.containers import Container
 from textual.screen import ModalScreen
 from textual.widgets import Label, Rule, Static
 
@@ -12,6 +15,44 @@ from ttydal.keybindings import get_key
 
 _k = lambda action: get_key("cache_modal", action)
 
+# Number of icons in the tracks cache visual bar
+_BAR_WIDTH = 10
+
+# Icon shown for each slot of the visual bar
+_BAR_ICON = "\u26c1"  # ⛁
+
+# Theme color for each icon state of the visual bar
+_ICON_COLORS = {
+    "icon-complete": "$success",
+    "icon-progress": "$warning",
+    "icon-pending": "$text-muted",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _icon_states(filled: int, partial: bool, width: int) -> tuple[str, ...]:
+    """Build the visual bar's icon classes for a fill level.
+
+    Memoized: for a given width there are only a handful of distinct bars.
+
+    Args:
+        filled: Number of completely filled slots
+        partial: Whether the slot after them is partly filled
+        width: Number of icons to display
+
+    Returns:
+        State name for each icon position
+    """
+    states = []
+    for i in range(width):
+        if i < filled:
+            states.append("icon-complete")
+        elif i == filled and partial:
+            states.append("icon-progress")
+        else:
+            states.append("icon-pending")
+    return tuple(states)
+
 
 class CacheModal(ModalScreen):
     """Modal screen displaying cache statistics."""
@@ -29,7 +70,7 @@ class CacheModal(ModalScreen):
 
     #cache-container {
         width: 50;
-        height: 20;
+        height: 21;
         background: $surface;
         padding: 1;
     }
@@ -54,7 +95,7 @@ class CacheModal(ModalScreen):
         text-align: center;
     }
 
-    #cache-container Label.visual-bar {
+    #cache-container Static.visual-bar {
         text-align: center;
         width: 100%;
     }
@@ -77,28 +118,6 @@ class CacheModal(ModalScreen):
         color: $text-muted;
     }
 
-    /* Theme-aware colors for visual bar icons */
-    .icon-complete {
-        color: $success;
-    }
-    .icon-progress {
-        color: $warning;
-    }
-    .icon-pending {
-        color: $text-muted;
-    }
-
-    #visual-bar-container {
-        align: center middle;
-        width: 100%;
-        height: auto;
-    }
-
-    #visual-bar-container Static {
-        width: auto;
-        min-width: 2;
-    }
-
     #legend-container {
         align: center middle;
         width: 100%;
@@ -109,10 +128,10 @@ class CacheModal(ModalScreen):
 
     def _get_icon_states(
         self, current: int, maximum: int, width: int = 10
-    ) -> list[str]:
-        """Get CSS class names for each icon in the visual bar.
+    ) -> tuple[str, ...]:
+        """Get the state of each icon in the visual bar.
 
-        States:
+        States (see _ICON_COLORS):
         - icon-complete: Filled slots (theme $success color)
         - icon-progress: Current slot at boundary (theme $warning color)
         - icon-pending: Empty slots (theme $text-muted color)
@@ -123,24 +142,15 @@ class CacheModal(ModalScreen):
             width: Number of icons to display
 
         Returns:
-            List of CSS class names for each icon position
+            State name for each icon position
         """
         if maximum == 0:
-            return ["icon-pending"] * width
+            return _icon_states(0, False, width)
 
         ratio = current / maximum
         filled_exact = ratio * width
         filled = int(filled_exact)
-
-        states = []
-        for i in range(width):
-            if i < filled:
-                states.append("icon-complete")
-            elif i == filled and filled_exact > filled:
-                states.append("icon-progress")
-            else:
-                states.append("icon-pending")
-        return states
+        return _icon_states(filled, filled_exact > filled, width)
 
     def _format_count(self, count: int) -> str:
         """Format large numbers with K suffix."""
@@ -155,7 +165,29 @@ class CacheModal(ModalScreen):
         return f"{size_mb * 1024:.0f} KB"
 
     def compose(self) -> ComposeResult:
-        """Compose the cache modal UI."""
+        """Compose the cache modal UI (stats are filled in on resume)."""
+        with Container(id="cache-container"):
+            yield Label("Cache Status", classes="title")
+            yield Rule()
+
+            # Tracks cache section
+            yield Label("", id="tracks-cache-title", classes="section-title")
+            # The whole bar is one line of markup rather than a widget per icon
+            yield Static("", id="tracks-cache-bar", classes="visual-bar")
+            yield Static("", id="tracks-cache-stats", classes="stat-label")
+            yield Static("", id="tracks-cache-hits", classes="stat-label")
+            yield Rule()
+
+            # Image cache section
+            yield Label("Cover Art Cache", classes="section-title")
+            yield Static("", id="image-cache-stats", classes="stat-label")
+            yield Static("", id="image-cache-dir", classes="cache-path")
+            yield Rule()
+
+            yield Label("Press ESC to close", classes="hint")
+
+    def on_screen_resume(self) -> None:
+        """Refresh the statistics each time the modal is shown."""
         # Tracks cache stats
         tracks_cache = TracksCache()
         tracks_stats = tracks_cache.get_stats()
@@ -165,45 +197,40 @@ class CacheModal(ModalScreen):
         max_tracks = tracks_stats["max_tracks"]
         ttl_hours = tracks_stats["ttl"] // 3600
 
-        # Image cache stats
-        image_cache = ImageCache()
-        image_stats = image_cache.get_stats()
-        image_count = image_stats["count"]
-        image_size_mb = image_stats["size_mb"]
-        image_cache_dir = image_stats["cache_dir"]
-
-        icon = "\u26c1"  # ⛁
-        icon_states = self._get_icon_states(tracks_count, max_tracks)
+        icon_states = self._get_icon_states(tracks_count, max_tracks, _BAR_WIDTH)
         album_label = "albums" if albums_count > 1 else "album"
         track_label = "tracks" if tracks_count > 1 else "track"
         tracks_display = f"{self._format_count(tracks_count)}/{self._format_count(max_tracks)} {track_label} over {albums_count} {album_label}"
 
         ttl_label = "hour" if ttl_hours == 1 else "hours"
 
-        with Container(id="cache-container"):
-            yield Label("Cache Status", classes="title")
-            yield Rule()
-
-            # Tracks cache section
-            yield Label(
-                f"Tracks Cache (ttl {ttl_hours} {ttl_label})", classes="section-title"
-            )
-            with Horizontal(id="visual-bar-container"):
-                for state in icon_states:
-                    yield Static(icon, classes=state)
-            yield Static(f"{tracks_display}", classes="stat-label")
-            yield Rule()
-
-            # Image cache section
-            yield Label("Cover Art Cache", classes="section-title")
-            yield Static(
-                f"Images: {image_count}  |  Size: {self._format_size(image_size_mb)}",
-                classes="stat-label",
-            )
-            yield Static(image_cache_dir, classes="cache-path")
-            yield Rule()
+        self.query_one("#tracks-cache-title", Label).update(
+            f"Tracks Cache (ttl {ttl_hours} {ttl_label})"
+        )
+        self.query_one("#tracks-cache-bar", Static).update(
+            " ".join(f"[{_ICON_COLORS[state]}]{_BAR_ICON}[/]" for state in icon_states)
+        )
+        self.query_one("#tracks-cache-stats", Static).update(tracks_display)
+        self.query_one("#tracks-cache-hits", Static).update(
+            f"Hits: {tracks_stats['hits']}  |  Misses: {tracks_stats['misses']}"
+            f"  |  Evicted: {tracks_stats['evictions']}"
+        )
+        # Image stats scan the cache directory, so don't hold up opening
+        self.run_worker(
+            self._update_image_stats(), exclusive=True, group="image-stats"
+        )
+
+    async def _update_image_stats(self) -> None:
+        """Fill in the image cache statistics."""
+        image_stats = await asyncio.to_thread(ImageCache().get_stats)
+        image_count = image_stats["count"]
+        image_size_mb = image_stats["size_mb"]
+        image_cache_dir = image_stats["cache_dir"]
 
-            yield Label("Press ESC to close", classes="hint")
+        self.query_one("#image-cache-stats", Static).update(
+            f"Images: {image_count}  |  Size: {self._format_size(image_size_mb)}"
+        )
+        self.query_one("#image-cache-dir", Static).update(image_cache_dir)
 
     def action_close_modal(self) -> None:
         """Close the cache modal."""
@@ -5,13 +5,17 @@ Images are loaded lazily - only when the item becomes visible in the viewport.
 """
 
 from textual.app import ComposeResult
-from textual.containers import Horizontal
+from textual.timer import Timer
 from textual.widgets import Label, Static
 from textual_image.widget import Image
 
 from ttydal.services.image_cache import ImageCache
 from ttydal.logger import log
 
+# Seconds an item must stay on screen before its cover art is loaded, so
+# flinging through a list doesn't start a download for every row passed
+_LOAD_DELAY = 0.2
+
 
 class CoverArtItem(Static):
     """A list item widget with cover art and text.
@@ -25,16 +29,12 @@ class CoverArtItem(Static):
 
     DEFAULT_CSS = """
     CoverArtItem {
+        layout: horizontal;
         height: 3;
         width: 1fr;
         padding: 0;
     }
 
-    CoverArtItem Horizontal {
-        height: 100%;
-        width: 1fr;
-    }
-
     CoverArtItem .cover-image {
         width: 6;
         height: 3;
@@ -87,40 +87,52 @@ class CoverArtItem(Static):
         self._text = text
         self._cover_url = cover_url
         self._image_widget: Image | None = None
+        self._text_label: Label | None = None
         self._image_loaded = False
-        self._load_scheduled = False
+        self._load_timer: Timer | None = None
 
     def compose(self) -> ComposeResult:
-        """Compose the cover art item UI."""
-        with Horizontal():
-            if self._cover_url:
-                # Create image widget - will be loaded lazily when visible
-                self._image_widget = Image(classes="cover-image")
-                yield self._image_widget
-            else:
-                # Placeholder when no cover art
-                yield Label("[.]", classes="cover-placeholder")
-
-            yield Label(self._text, classes="item-text")
+        """Compose the cover art item UI.
+
+        The item lays its children out horizontally itself, rather than
+        through a Horizontal container, to keep long lists one widget per
+        row lighter.
+        """
+        if self._cover_url:
+            # Create image widget - will be loaded lazily when visible
+            self._image_widget = Image(classes="cover-image")
+            yield self._image_widget
+        else:
+            # Placeholder when no cover art
+            yield Label("[.]", classes="cover-placeholder")
+
+        self._text_label = Label(self._text, classes="item-text")
+        yield self._text_label
 
     def on_show(self) -> None:
         """Called when the widget becomes visible - trigger lazy loading."""
         self._schedule_load()
 
+    def on_hide(self) -> None:
+        """Called when the widget scrolls out of view - drop a pending load."""
+        if self._load_timer is not None:
+            self._load_timer.stop()
+            self._load_timer = None
+
     def _schedule_load(self) -> None:
         """Schedule image loading if not already done."""
         if (
             self._cover_url
             and self._image_widget
             and not self._image_loaded
-            and not self._load_scheduled
+            and self._load_timer is None
         ):
-            self._load_scheduled = True
-            # Small delay to avoid loading during fast scrolling
-            self.set_timer(0.1, self._trigger_load)
+            # Wait a moment: if we're scrolled past, on_hide cancels this
+            self._load_timer = self.set_timer(_LOAD_DELAY, self._trigger_load)
 
     def _trigger_load(self) -> None:
         """Trigger the actual image load."""
+        self._load_timer = None
         if not self._image_loaded and self._cover_url and self._image_widget:
             self.run_worker(self._load_cover_art())
 
@@ -146,8 +158,6 @@ class CoverArtItem(Static):
             text: New text to display
         """
         self._text = text
-        try:
-            label = self.query_one(".item-text", Label)
-            label.update(text)
-        except Exception:
-            pass
+        # Before compose, the label picks up self._text when it's created
+        if self._text_label is not None:
+            self._text_label.update(text)
@@ -1,5 +1,6 @@
 """Login modal for Tidal OAuth authentication."""
 
+import asyncio
 import webbrowser
 import pyperclip
 
@@ -119,6 +120,8 @@ class LoginModal(ModalScreen):
         self.login_url = login_url
         self.code = code
         self.status_text = status
+        # Set once the widgets exist and can be updated
+        self.mounted_event = asyncio.Event()
 
     def compose(self) -> ComposeResult:
         """Compose the login modal UI."""
@@ -149,6 +152,10 @@ class LoginModal(ModalScreen):
                 yield Button("Check Login Status", variant="primary", id="check-btn")
                 yield Button("Close", variant="default", id="close-btn")
 
+    def on_mount(self) -> None:
+        """Signal that the modal's widgets are ready."""
+        self.mounted_event.set()
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses.
 
@@ -204,6 +211,9 @@ class LoginModal(ModalScreen):
         Args:
             status: New status message
         """
+        if status == self.status_text:
+            return
+        self.status_text = status
         try:
             status_label = self.query_one("#status-label", Label)
             status_label.update(status)
@@ -12,6 +12,7 @@ from textual_image.widget import Image
 from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
 from ttydal.config import ConfigManager
 from ttydal.services.image_cache import ImageCache
+from ttydal.components.cover_art_modal import CoverArtModal
 from ttydal.logger import log
 
 
@@ -115,7 +116,6 @@ class PlayerBar(Container):
         """Open cover art modal when the cover art area is clicked."""
         # Cover art occupies the leftmost 8 columns of the player bar
         if event.x < 8 and self._current_cover_url:
-            from ttydal.components.cover_art_modal import CoverArtModal
             self.app.push_screen(CoverArtModal(self._current_cover_url))
 
     def on_key(self, event) -> None:
@@ -123,7 +123,6 @@ class PlayerBar(Container):
         if event.key == "enter":
             try:
                 if self.query_one("#cover-art-container").has_focus and self._current_cover_url:
-                    from ttydal.components.cover_art_modal import CoverArtModal
                     self.app.push_screen(CoverArtModal(self._current_cover_url))
                     event.stop()
             except Exception:
@@ -147,8 +147,10 @@ class SearchModal(ModalScreen):
     def __init__(self, albums: list, tracks: list) -> None:
         """Initialize the search modal.
 
+        The lists are shared with their owners and are only ever read here.
+
         Args:
-            albums: List of album dictionaries with id, name, type keys
+            albums: AlbumEntry items from the albums list
             tracks: List of track dictionaries with id, name, artist, album keys
         """
         super().__init__()
@@ -163,9 +165,21 @@ class SearchModal(ModalScreen):
             yield Input(placeholder="Type to search...", id="search-input")
             yield ListView(id="results-list")
 
-    def on_mount(self) -> None:
-        """Focus the search input when mounted."""
+    def update_data(self, albums: list, tracks: list) -> None:
+        """Replace the searchable albums and tracks.
+
+        Args:
+            albums: AlbumEntry items from the albums list
+            tracks: List of track dictionaries with id, name, artist, album keys
+        """
+        self.albums = albums
+        self.tracks = tracks
+
+    def on_screen_resume(self) -> None:
+        """Start from an empty query each time the modal is shown."""
         search_input = self.query_one("#search-input", Input)
+        # Clearing the input also clears the results via on_input_changed
+        search_input.value = ""
         search_input.focus()
 
     def on_input_changed(self, event: Input.Changed) -> None:
@@ -196,15 +210,15 @@ class SearchModal(ModalScreen):
         # Search albums
         album_matches = []
         for album in self.albums:
-            album_name = album.get("name", "")
+            album_name = album.name
             matches = find_near_matches(query.lower(), album_name.lower(), max_l_dist=2)
             if matches:
                 album_matches.append(
                     {
                         "type": "album",
-                        "id": album["id"],
+                        "id": album.id,
                         "name": album_name,
-                        "album_type": album.get("type", "album"),
+                        "album_type": album.type,
                         "match_start": matches[0].start,
                     }
                 )
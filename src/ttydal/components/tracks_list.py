@@ -8,12 +8,17 @@ from textual.binding import Binding
 from textual.containers import Container
 from textual.widgets import ListItem, ListView, Label
 from textual.message import Message
+from textual.worker import Worker
 
 from ttydal.services.tidal_client import TidalClient
 from ttydal.services import TracksService, TidalServiceError
 from ttydal.services.tracks_cache import TracksCache
+from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
+from ttydal.config import ConfigManager
 from ttydal.logger import log
 from ttydal.components.cover_art_item import CoverArtItem
+from ttydal.components.cover_art_modal import CoverArtModal
+from ttydal.components.player_bar import PlayerBar
 from ttydal.keybindings import get_key
 
 _k = lambda action: get_key("tracks_list", action)
@@ -126,23 +131,26 @@ class TracksList(Container):
         self._prefetch_in_progress: bool = False
         # Stream recovery state
         self._stream_recovery_in_progress: bool = False
+        # Child widget, kept so methods don't have to query for it
+        self._list_view = ListView(id="tracks-listview")
+
+    @property
+    def list_view(self) -> ListView:
+        """Get the tracks ListView."""
+        return self._list_view
 
     def compose(self) -> ComposeResult:
         """Compose the tracks list UI."""
         yield Label("(t)racks")
-        yield ListView(id="tracks-listview")
+        yield self._list_view
 
     def on_mount(self) -> None:
         """Initialize when mounted."""
-        from ttydal.config import ConfigManager
-
         if not ConfigManager().list_striping:
             self.add_class("no-stripes")
 
         # Register callbacks for track end and time position events
         if not self._track_end_callback_registered:
-            from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
-
             player = MpvPlaybackEngine()
             player.register_callback("on_track_end", self._on_track_end)
             player.register_callback("on_time_pos_change", self._on_time_pos_change)
@@ -156,8 +164,6 @@ class TracksList(Container):
         log("TracksList: Auto-play callback triggered")
 
         # Check if auto-play is enabled
-        from ttydal.config import ConfigManager
-
         config = ConfigManager()
         if not config.auto_play:
             log("  - Auto-play disabled, doing nothing")
@@ -222,7 +228,7 @@ class TracksList(Container):
         """
         try:
             if self.current_item_id == self._active_playlist_item_id:
-                list_view = self.query_one("#tracks-listview", ListView)
+                list_view = self._list_view
                 list_view.index = next_index
             self._update_track_indicators()
         except Exception as e:
@@ -243,15 +249,11 @@ class TracksList(Container):
             return
 
         # Check if auto-play is enabled (no point pre-fetching if disabled)
-        from ttydal.config import ConfigManager
-
         config = ConfigManager()
         if not config.auto_play:
             return
 
         # Get track duration from player
-        from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
-
         player = MpvPlaybackEngine()
         duration = player.get_duration()
 
@@ -341,8 +343,6 @@ class TracksList(Container):
         if self._stream_recovery_in_progress:
             return
 
-        from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
-
         player = MpvPlaybackEngine()
         track = player.get_current_track()
         if not track:
@@ -365,8 +365,6 @@ class TracksList(Container):
 
     def _start_stream_recovery(self, track: dict, resume_pos: float) -> None:
         """Launch the stream recovery worker (must run on the Textual event-loop thread)."""
-        from ttydal.components.player_bar import PlayerBar
-
         try:
             player_bar = self.app.query_one(PlayerBar)
             player_bar.set_reconnecting(True)
@@ -384,10 +382,6 @@ class TracksList(Container):
         Runs every 5 s for the first attempt, then every 10 s for up to ~3 minutes.
         Once a URL is obtained the track is resumed from the saved position.
         """
-        from ttydal.config import ConfigManager
-        from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
-        from ttydal.components.player_bar import PlayerBar
-
         config = ConfigManager()
         tidal = TidalClient()
 
@@ -467,8 +461,6 @@ class TracksList(Container):
         log(f"TracksList: Scheduling playback retry for '{track_info.get('name')}'")
         self._stream_recovery_in_progress = True
 
-        from ttydal.components.player_bar import PlayerBar
-
         try:
             player_bar = self.app.query_one(PlayerBar)
             player_bar.set_reconnecting(True)
@@ -487,9 +479,6 @@ class TracksList(Container):
         (15 attempts total). On success, posts TrackSelected with the fetched URL so
         PlayerPage handles the full UI update (cover art, vibrant color, stream quality).
         """
-        from ttydal.config import ConfigManager
-        from ttydal.components.player_bar import PlayerBar
-
         config = ConfigManager()
         tidal = TidalClient()
 
@@ -575,8 +564,6 @@ class TracksList(Container):
 
     def _capture_active_playlist(self) -> None:
         """Snapshot current tracks as the active playback playlist."""
-        from ttydal.config import ConfigManager
-
         self._active_playlist = list(self.tracks)
         self._active_playlist_item_id = self.current_item_id
         if ConfigManager().shuffle:
@@ -600,8 +587,6 @@ class TracksList(Container):
 
     def _get_next_track_index(self) -> int:
         """Get the next track index, respecting shuffle mode."""
-        from ttydal.config import ConfigManager
-
         config = ConfigManager()
 
         if config.shuffle and self.shuffled_indices:
@@ -626,8 +611,6 @@ class TracksList(Container):
 
     def _get_previous_track_index(self) -> int:
         """Get the previous track index, respecting shuffle mode."""
-        from ttydal.config import ConfigManager
-
         config = ConfigManager()
 
         if config.shuffle and self.shuffled_indices:
@@ -652,13 +635,16 @@ class TracksList(Container):
 
     def load_tracks(
         self, item_id: str, item_name: str, item_type: str = "album"
-    ) -> None:
+    ) -> Worker:
         """Load ALL tracks for a specific album or playlist.
 
         Args:
             item_id: The item ID to load tracks from
             item_name: The item name for display
             item_type: Type of item ('album', 'playlist', or 'favorites')
+
+        Returns:
+            The loading worker; await its wait() to know when tracks are in
         """
         log(f"TracksList.load_tracks({item_id}, {item_name}, {item_type}) called")
         self.current_album_name = item_name
@@ -677,7 +663,7 @@ class TracksList(Container):
 
         # Run the loading in a worker so UI can update
         # Use exclusive=True to cancel any previous loading workers
-        self.run_worker(
+        return self.run_worker(
             self._load_tracks_async(item_id, item_name, item_type), exclusive=True
         )
 
@@ -693,7 +679,7 @@ class TracksList(Container):
         """
         try:
             # Await clear to ensure old items are fully removed from DOM
-            list_view = self.query_one("#tracks-listview", ListView)
+            list_view = self._list_view
             await list_view.clear()
 
             # Check cache first
@@ -723,6 +709,7 @@ class TracksList(Container):
 
             # Build tracks array locally then assign atomically
             new_tracks = []
+            items = []
 
             for idx, track in enumerate(tracks_list, 1):
                 track_name = track["name"]
@@ -734,9 +721,7 @@ class TracksList(Container):
                 album_name = track.get("album", item_name)
 
                 display_text = f"{idx}. {track_name} - {artist} ({duration})"
-                list_view.append(
-                    ListItem(CoverArtItem(display_text, cover_url=cover_url))
-                )
+                items.append(ListItem(CoverArtItem(display_text, cover_url=cover_url)))
                 new_tracks.append(
                     {
                         "id": str(track["id"]),
@@ -749,6 +734,8 @@ class TracksList(Container):
                     }
                 )
 
+            # Wait for the items to mount so the DOM is settled when we select
+            await list_view.extend(items)
             self.tracks = new_tracks
             log(f"  - Loaded {len(self.tracks)} tracks")
 
@@ -757,8 +744,6 @@ class TracksList(Container):
             header.update(f"(t)racks - {item_name}")
 
             # Regenerate shuffle order if shuffle is enabled
-            from ttydal.config import ConfigManager
-
             config = ConfigManager()
             if config.shuffle:
                 self._generate_shuffle_order()
@@ -766,9 +751,9 @@ class TracksList(Container):
             # Update visual indicators (in case we're reloading while a track is playing)
             self._update_track_indicators()
 
-            # Select initial track after a small delay to ensure DOM is settled
+            # Select initial track (items are already mounted)
             if self.tracks:
-                self.set_timer(0.1, self._select_initial_track)
+                self._select_initial_track()
         except TidalServiceError as e:
             log(f"TracksList: Service error loading tracks: {e}")
             header = self.query_one(Label)
@@ -798,7 +783,7 @@ class TracksList(Container):
         Otherwise, select the first track.
         """
         try:
-            list_view = self.query_one("#tracks-listview", ListView)
+            list_view = self._list_view
             if not self.tracks or len(list_view.children) == 0:
                 return
 
@@ -821,7 +806,7 @@ class TracksList(Container):
     def _update_track_indicators(self) -> None:
         """Update track list to show '>' indicator for currently playing track."""
         try:
-            list_view = self.query_one("#tracks-listview", ListView)
+            list_view = self._list_view
             # Only show indicator if viewing the album that contains the playing track
             show_indicator = self.current_item_id == self._playing_item_id
             for idx, list_item in enumerate(list_view.children):
@@ -870,7 +855,7 @@ class TracksList(Container):
         """
         log("=" * 80)
         log("TracksList: Space key action triggered")
-        list_view = self.query_one("#tracks-listview", ListView)
+        list_view = self._list_view
         index = list_view.index
         log(f"  - ListView index: {index}")
         log(f"  - Total tracks: {len(self.tracks)}")
@@ -879,8 +864,6 @@ class TracksList(Container):
         if index is None or index >= len(self.tracks):
             log("  - No track selected, toggling pause/play")
             # No track selected, toggle pause on whatever is playing
-            from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
-
             player = MpvPlaybackEngine()
             player.toggle_pause()
             log("=" * 80)
@@ -892,8 +875,6 @@ class TracksList(Container):
         )
 
         # Get currently playing track
-        from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
-
         player = MpvPlaybackEngine()
         current_track = player.get_current_track()
         log(
@@ -952,12 +933,12 @@ class TracksList(Container):
 
     def action_cursor_down(self) -> None:
         """Move cursor down in the list."""
-        list_view = self.query_one("#tracks-listview", ListView)
+        list_view = self._list_view
         list_view.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up in the list."""
-        list_view = self.query_one("#tracks-listview", ListView)
+        list_view = self._list_view
         list_view.action_cursor_up()
 
     def action_focus_albums(self) -> None:
@@ -966,14 +947,14 @@ class TracksList(Container):
 
         try:
             albums_list = self.app.query_one(AlbumsList)
-            list_view = albums_list.query_one("#albums-listview")
+            list_view = albums_list.list_view
             list_view.focus()
         except Exception:
             pass
 
     def action_show_art(self) -> None:
         """Open cover art modal for the currently highlighted track."""
-        list_view = self.query_one("#tracks-listview", ListView)
+        list_view = self._list_view
         index = list_view.index
         if index is None or index >= len(self.tracks):
             return
@@ -981,7 +962,6 @@ class TracksList(Container):
         if not cover_url:
             self.app.notify("No cover art available", timeout=2)
             return
-        from ttydal.components.cover_art_modal import CoverArtModal
         self.app.push_screen(CoverArtModal(cover_url))
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
@@ -1031,7 +1011,7 @@ class TracksList(Container):
         self._playing_item_id = self._active_playlist_item_id
 
         if self.current_item_id == self._active_playlist_item_id:
-            list_view = self.query_one("#tracks-listview", ListView)
+            list_view = self._list_view
             list_view.index = next_index
         self._update_track_indicators()
         self.post_message(self.TrackSelected(next_track["id"], next_track))
@@ -1047,7 +1027,7 @@ class TracksList(Container):
         self._playing_item_id = self._active_playlist_item_id
 
         if self.current_item_id == self._active_playlist_item_id:
-            list_view = self.query_one("#tracks-listview", ListView)
+            list_view = self._list_view
             list_view.index = prev_index
         self._update_track_indicators()
         self.post_message(self.TrackSelected(prev_track["id"], prev_track))
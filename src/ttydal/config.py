@@ -5,14 +5,19 @@ Run `ttydal --init-config` to create a config file from bundled defaults.
 The app works without a config file (uses bundled defaults in-memory).
 """
 
+import atexit
 import json
 import shutil
+import threading
 from importlib import resources
 from typing import Any
 from pathlib import Path
 
 from ttydal.dirs import config_dir
 
+# Seconds to wait after the last change before writing config.json
+_SAVE_DELAY = 0.5
+
 
 class ConfigManager:
     """Singleton configuration manager for ttydal."""
@@ -35,8 +40,14 @@ class ConfigManager:
         self.config_file = self.config_dir / "config.json"
         self._config: dict[str, Any] = {}
         self._debug_override: bool = False
+        # Guards self._config and the pending save timer
+        self._save_lock = threading.Lock()
+        # Serializes writes so an older snapshot never lands after a newer one
+        self._write_lock = threading.Lock()
+        self._save_timer: threading.Timer | None = None
         self._ensure_dir(self.config_dir)
         self._load_config()
+        atexit.register(self.flush)
         self._initialized = True
 
     @staticmethod
@@ -91,20 +102,52 @@ class ConfigManager:
         shutil.copy2(str(default_config_file), str(cfg_file))
         return cfg_file
 
-    def _save_config(self) -> None:
-        """Save configuration to file."""
-        self._ensure_dir(self.config_dir)
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(self._config, f, indent=2)
+    def _save_config(self, config: dict[str, Any]) -> None:
+        """Save configuration to file.
+
+        Args:
+            config: Snapshot of the configuration to write
+        """
+        try:
+            self._ensure_dir(self.config_dir)
+            with open(self.config_file, "w", encoding="utf-8") as f:
+                json.dump(config, f, indent=2)
+        except OSError as e:
+            # Imported here: the logger itself depends on ConfigManager
+            from ttydal.logger import log
+
+            log(f"ConfigManager: Failed to save config: {e}")
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
         return self._config.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
-        """Set a configuration value and save."""
-        self._config[key] = value
-        self._save_config()
+        """Set a configuration value and schedule a save.
+
+        Rapid changes are coalesced into a single write, made off the
+        caller's thread once no change has happened for _SAVE_DELAY seconds.
+        """
+        with self._save_lock:
+            self._config[key] = value
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(_SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write any pending configuration changes to disk now."""
+        with self._write_lock:
+            with self._save_lock:
+                if self._save_timer is None:
+                    return
+                self._save_timer.cancel()
+                self._save_timer = None
+                # Snapshot under the lock: set() may run on another thread
+                config = dict(self._config)
+            # Write without holding _save_lock so set() never waits on disk
+            self._save_config(config)
 
     @property
     def theme(self) -> str:
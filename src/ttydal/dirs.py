@@ -51,3 +51,8 @@ def log_dir() -> Path:
 def image_cache_dir() -> Path:
     """Return the directory for cached cover art images."""
     return cache_dir() / "images"
+
+
+def albums_cache_file() -> Path:
+    """Return the file caching the albums & playlists list."""
+    return cache_dir() / "albums.json"
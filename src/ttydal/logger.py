@@ -4,6 +4,7 @@ import sys
 from datetime import datetime
 from typing import Any
 
+from ttydal.config import ConfigManager
 from ttydal.dirs import log_dir
 
 
@@ -41,9 +42,6 @@ class DebugLogger:
             True if logging is enabled, False otherwise
         """
         try:
-            # Import here to avoid circular dependency
-            from ttydal.config import ConfigManager
-
             config = ConfigManager()
             return config.debug_logging_enabled
         except Exception:
@@ -75,12 +73,15 @@ class DebugLogger:
 
         self._file_setup_done = True
 
-    def log(self, *args: Any, **kwargs: Any) -> None:
+    def log(self, message: str, *args: Any) -> None:
         """Log a message to both the file and stderr.
 
+        Formatting is lazy: with args, the message is %-formatted only if
+        debug logging is enabled, so disabled calls cost almost nothing.
+
         Args:
-            *args: Arguments to log (like print)
-            **kwargs: Keyword arguments (like print)
+            message: Message, or %-format string when args are given
+            *args: Values for the %-format placeholders in message
         """
         # Check if debug logging is enabled FIRST
         if not self._is_logging_enabled():
@@ -89,8 +90,9 @@ class DebugLogger:
         # Setup log file lazily (only if logging is enabled)
         self._setup_log_file()
 
+        if args:
+            message = message % args
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        message = " ".join(str(arg) for arg in args)
         log_line = f"[{timestamp}] {message}\n"
 
         # Write to file
@@ -120,11 +122,11 @@ def get_logger() -> DebugLogger:
     return _logger
 
 
-def log(*args: Any, **kwargs: Any) -> None:
+def log(message: str, *args: Any) -> None:
     """Convenience function to log messages.
 
     Args:
-        *args: Arguments to log
-        **kwargs: Keyword arguments
+        message: Message, or %-format string when args are given
+        *args: Values for the %-format placeholders in message
     """
-    get_logger().log(*args, **kwargs)
+    get_logger().log(message, *args)
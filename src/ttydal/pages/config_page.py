@@ -6,6 +6,7 @@ from textual.containers import Container, Vertical, VerticalScroll, Horizontal
 from textual.widgets import Label, Button, Select, Switch
 from textual.message import Message
 
+from ttydal.api_logger import get_api_logger
 from ttydal.config import ConfigManager
 from ttydal.keybindings import get_key
 
@@ -280,6 +281,7 @@ class ConfigPage(Container):
             if event.value == self.config.api_logging_enabled:
                 return
             self.config.api_logging_enabled = event.value
+            get_api_logger().invalidate_enabled()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press events.
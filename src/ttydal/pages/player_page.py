@@ -13,7 +13,9 @@ from ttydal.services.mpv_playback_engine import MpvPlaybackEngine
 from ttydal.services.tidal_client import TidalClient
 from ttydal.config import ConfigManager
 from ttydal.services import PlaybackService
+from ttydal.services.mpris_service import MprisService
 from ttydal.keybindings import get_key
+from ttydal.logger import log
 
 _k = lambda action: get_key("player_page", action)
 
@@ -44,25 +46,29 @@ class PlayerPage(Container):
         self.tidal = TidalClient()
         self.config = ConfigManager()
         self.playback_service = PlaybackService(self.tidal, self.player)
+        # Started in on_mount
+        self.mpris_service: MprisService | None = None
+        # Child widgets, kept so handlers don't have to query for them
+        self.player_bar = PlayerBar()
+        self.albums_list = AlbumsList()
+        self.tracks_list = TracksList()
 
     def compose(self) -> ComposeResult:
         """Compose the player page UI."""
-        yield PlayerBar()
+        yield self.player_bar
         with Horizontal():
-            yield AlbumsList()
-            yield TracksList()
+            yield self.albums_list
+            yield self.tracks_list
 
     def on_mount(self) -> None:
         """Initialize page when mounted."""
-        player_bar = self.query_one(PlayerBar)
+        player_bar = self.player_bar
         player_bar.update_quality_display(self.config.quality)
 
-        from ttydal.services.mpris_service import MprisService
-
         self.mpris_service = MprisService(self.player)
         self.mpris_service.start()
 
-        tracks_list = self.query_one(TracksList)
+        tracks_list = self.tracks_list
         self.mpris_service.set_navigation_callbacks(
             on_next=tracks_list.play_next_track,
             on_prev=tracks_list.play_previous_track,
@@ -74,7 +80,7 @@ class PlayerPage(Container):
         Args:
             event: Album/playlist selection event
         """
-        tracks_list = self.query_one(TracksList)
+        tracks_list = self.tracks_list
         tracks_list.load_tracks(event.item_id, event.item_name, event.item_type)
 
     async def on_tracks_list_track_selected(self, event: TracksList.TrackSelected) -> None:
@@ -83,13 +89,11 @@ class PlayerPage(Container):
         Args:
             event: Track selection event
         """
-        from ttydal.logger import log
-
         log("=" * 80)
         log("PlayerPage.on_tracks_list_track_selected() - Message received")
-        log(f"  - Track: {event.track_info.get('name', 'Unknown')}")
-        log(f"  - Track ID: {event.track_id}")
-        log(f"  - Artist: {event.track_info.get('artist', 'Unknown')}")
+        log("  - Track: %s", event.track_info.get("name", "Unknown"))
+        log("  - Track ID: %s", event.track_id)
+        log("  - Artist: %s", event.track_info.get("artist", "Unknown"))
         if event.prefetched_url:
             log("  - Has pre-fetched URL: Yes")
 
@@ -108,7 +112,7 @@ class PlayerPage(Container):
             # Slow path: must fetch the URL from Tidal — blocking HTTP call.
             # Run in a thread so the event loop stays responsive if the network is down.
             log("  - No pre-fetched URL, fetching from Tidal (in thread)…")
-            player_bar = self.query_one(PlayerBar)
+            player_bar = self.player_bar
             fetch_future = asyncio.get_running_loop().run_in_executor(
                 None,
                 lambda: self.playback_service.play_track(
@@ -131,7 +135,7 @@ class PlayerPage(Container):
                 except asyncio.TimeoutError:
                     player_bar.set_reconnecting(False)
                     track_name = event.track_info.get("name", "Track")
-                    log(f"  - play_track timed out for '{track_name}'")
+                    log("  - play_track timed out for '%s'", track_name)
                     self.app.notify(
                         f"Failed to load '{track_name}': network timeout",
                         severity="error",
@@ -147,11 +151,11 @@ class PlayerPage(Container):
 
         if result.success:
             # Notify MPRIS so playerctl / system widgets update immediately
-            if hasattr(self, "mpris_service"):
+            if self.mpris_service is not None:
                 self.mpris_service.notify_track_changed()
 
             # Update player bar with actual stream quality and cover art
-            player_bar = self.query_one(PlayerBar)
+            player_bar = self.player_bar
             player_bar.update_stream_quality(result.stream_metadata)
 
             # Update cover art
@@ -165,13 +169,11 @@ class PlayerPage(Container):
                 player_bar.update_vibrant_color(None)
 
             # Update album list to show which album/playlist is currently playing
-            tracks_list = self.query_one(TracksList)
+            tracks_list = self.tracks_list
             playing_item_id = tracks_list._active_playlist_item_id or tracks_list.current_item_id
             if playing_item_id:
-                log(
-                    f"  - Updating album indicator for item: {playing_item_id}"
-                )
-                albums_list = self.query_one(AlbumsList)
+                log("  - Updating album indicator for item: %s", playing_item_id)
+                albums_list = self.albums_list
                 albums_list.set_playing_item(playing_item_id)
 
             # Show notification if quality fallback was applied
@@ -195,7 +197,7 @@ class PlayerPage(Container):
             # real logout. Start the retry loop instead of showing a hard error.
             if result.error_message == "Not logged in":
                 log("  - Network down (not logged in) — scheduling playback retry…")
-                tracks_list = self.query_one(TracksList)
+                tracks_list = self.tracks_list
                 tracks_list.start_playback_retry(event.track_id, event.track_info)
                 log("=" * 80)
                 return
@@ -210,59 +212,59 @@ class PlayerPage(Container):
             self.app.notify(notification_msg, severity="error", timeout=10)
             log("=" * 80)
 
-    def focus_albums(self) -> None:
+    def action_focus_albums(self) -> None:
         """Focus the albums list and select first album if none selected."""
-        albums_list = self.query_one(AlbumsList)
-        list_view = albums_list.query_one("#albums-listview")
+        albums_list = self.albums_list
+        list_view = albums_list.list_view
         list_view.focus()
         if list_view.index is None and albums_list.albums:
             list_view.index = 0
 
-    def focus_tracks(self) -> None:
+    def action_focus_tracks(self) -> None:
         """Focus the tracks list and select first track."""
-        tracks_list = self.query_one(TracksList)
-        list_view = tracks_list.query_one("#tracks-listview")
+        tracks_list = self.tracks_list
+        list_view = tracks_list.list_view
         list_view.focus()
         if tracks_list.tracks and list_view.index is None:
             list_view.index = 0
 
     def action_toggle_playback(self) -> None:
-        """Toggle play/pause (spacebar action at PlayerPage level)."""
-        from ttydal.logger import log
-
-        log("PlayerPage.action_toggle_playback() called")
+        """Toggle play/pause."""
         self.player.toggle_pause()
 
-    def toggle_playback(self) -> None:
-        """Toggle play/pause (called from app level)."""
-        from ttydal.logger import log
-
-        log("PlayerPage.toggle_playback() called")
-        self.player.toggle_pause()
-
-    def seek_backward(self) -> None:
+    def action_seek_backward(self) -> None:
         """Seek backward 10 seconds."""
         self.player.seek(-10)
 
-    def seek_forward(self) -> None:
+    def action_seek_forward(self) -> None:
         """Seek forward 10 seconds."""
         self.player.seek(10)
 
-    def play_next(self) -> None:
+    def action_play_next(self) -> None:
         """Play next track."""
-        tracks_list = self.query_one(TracksList)
+        tracks_list = self.tracks_list
         tracks_list.play_next_track()
 
-    def play_previous(self) -> None:
+    def action_play_previous(self) -> None:
         """Play previous track."""
-        tracks_list = self.query_one(TracksList)
+        tracks_list = self.tracks_list
         tracks_list.play_previous_track()
 
     def on_shuffle_changed(self, enabled: bool) -> None:
-        """Handle shuffle setting change.
+        """Apply a change of the shuffle setting.
+
+        Args:
+            enabled: New shuffle setting
+        """
+        # Notify TracksList to reshuffle if enabling
+        self.tracks_list.on_shuffle_changed(enabled)
+
+    def on_vibrant_color_changed(self, enabled: bool) -> None:
+        """Apply a change of the vibrant color setting.
 
         Args:
-            enabled: Whether shuffle is now enabled
+            enabled: New vibrant color setting
         """
-        tracks_list = self.query_one(TracksList)
-        tracks_list.on_shuffle_changed(enabled)
+        # Clear vibrant color from player bar if disabled
+        if not enabled:
+            self.player_bar.update_vibrant_color(None)
@@ -32,6 +32,7 @@ import asyncio
 
 from ttydal.exceptions import TidalServiceError, DataFetchError
 from ttydal.logger import log
+from ttydal.services.albums_cache import AlbumsCache
 from ttydal.services.image_cache import ImageCache
 
 COVER_IMAGE_SIZE = 320
@@ -251,6 +252,7 @@ __all__ = [
     "AlbumsService",
     "TracksService",
     "TracksCache",
+    "AlbumsCache",
     "PlaybackService",
     "PlaybackResult",
     "TidalServiceError",
@@ -0,0 +1,113 @@
+"""On-disk cache for the albums & playlists list.
+
+Lets the albums list render straight away on startup instead of waiting
+for Tidal. Entries older than the TTL are still shown, but the caller
+should refresh them from Tidal in the background (stale-while-revalidate).
+The list belongs to one Tidal account; after switching accounts it is
+ignored rather than shown.
+"""
+
+import json
+import time
+from pathlib import Path
+
+from ttydal.dirs import albums_cache_file
+from ttydal.logger import log
+
+
+class AlbumsCache:
+    """Singleton on-disk cache for the albums list.
+
+    Cache locations:
+    - Linux: ~/.cache/ttydal/albums.json
+    - macOS: ~/Library/Caches/ttydal/albums.json
+    - Windows: %LOCALAPPDATA%/ttydal/albums.json
+    """
+
+    _instance = None
+
+    DEFAULT_TTL = 600  # 10 minutes
+
+    def __new__(cls):
+        """Ensure only one instance exists."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self, ttl: int | None = None):
+        """Initialize the albums cache.
+
+        Args:
+            ttl: Seconds before a cached list counts as stale
+        """
+        if self._initialized:
+            return
+        self._cache_file: Path = albums_cache_file()
+        self.ttl = ttl or self.DEFAULT_TTL
+        self._initialized = True
+
+    def get(self, user_id: str) -> tuple[list[dict], float] | None:
+        """Get the cached albums list.
+
+        Args:
+            user_id: Tidal user the list must belong to
+
+        Returns:
+            (albums, age in seconds), or None if nothing usable is cached
+        """
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            albums = data["albums"]
+            age = time.time() - data["saved_at"]
+            cached_user_id = data["user_id"]
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log(f"AlbumsCache: Ignoring unreadable cache: {e}")
+            return None
+        if cached_user_id != user_id:
+            log("AlbumsCache: Ignoring cache saved for another user")
+            return None
+        log(f"AlbumsCache: Loaded {len(albums)} items ({age:.0f}s old)")
+        return albums, age
+
+    def is_fresh(self, age: float) -> bool:
+        """Check whether a cached list of the given age is still fresh.
+
+        Args:
+            age: Age in seconds, as returned by get()
+
+        Returns:
+            True if the list doesn't need refreshing yet
+        """
+        return 0 <= age < self.ttl
+
+    def set(self, albums: list[dict], user_id: str) -> None:
+        """Save the albums list.
+
+        Args:
+            albums: Album/playlist dictionaries (AlbumDict)
+            user_id: Tidal user the list belongs to
+        """
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write aside and rename so a crash never leaves a torn file
+            tmp_file = self._cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"saved_at": time.time(), "user_id": user_id, "albums": albums},
+                    f,
+                )
+            tmp_file.replace(self._cache_file)
+        except OSError as e:
+            log(f"AlbumsCache: Failed to save cache: {e}")
+
+    def clear(self) -> None:
+        """Remove the cached albums list."""
+        try:
+            self._cache_file.unlink(missing_ok=True)
+        except OSError as e:
+            log(f"AlbumsCache: Failed to remove cache: {e}")
+        log("AlbumsCache: Cache cleared")
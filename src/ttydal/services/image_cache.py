@@ -34,6 +34,7 @@ class ImageCache:
     _instance = None
     _cache_dir: Path
     _memory_cache: dict[str, PILImage.Image]
+    _inflight: dict[str, asyncio.Future]
 
     def __new__(cls):
         """Ensure only one instance exists."""
@@ -50,6 +51,8 @@ class ImageCache:
         self._cache_dir = image_cache_dir()
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._memory_cache = {}
+        # Lookups still running, by URL, so concurrent requests share one
+        self._inflight = {}
         self._initialized = True
         log(f"ImageCache initialized, cache dir: {self._cache_dir}")
 
@@ -115,6 +118,9 @@ class ImageCache:
     async def get_image(self, url: str) -> Optional[PILImage.Image]:
         """Get image from URL asynchronously.
 
+        Items sharing a cover (e.g. tracks of one album) that ask at the
+        same time wait on a single download instead of starting their own.
+
         Args:
             url: URL of the image to fetch
 
@@ -124,8 +130,21 @@ class ImageCache:
         if not url:
             return None
 
-        # Run the sync version in a thread pool
-        return await asyncio.to_thread(self.get_image_sync, url)
+        # Already in memory: no need for a thread
+        img = self._memory_cache.get(self._url_to_cache_key(url))
+        if img is not None:
+            return img
+
+        future = self._inflight.get(url)
+        if future is None:
+            # Run the sync version in a thread pool
+            future = asyncio.ensure_future(
+                asyncio.to_thread(self.get_image_sync, url)
+            )
+            self._inflight[url] = future
+            future.add_done_callback(lambda _: self._inflight.pop(url, None))
+        # Shielded so one cancelled caller doesn't cancel it for the others
+        return await asyncio.shield(future)
 
     def clear_memory_cache(self) -> None:
         """Clear the in-memory image cache."""
@@ -1,5 +1,6 @@
 """MPV playback engine singleton wrapper for ttydal."""
 
+import traceback
 from typing import Callable
 
 import mpv
@@ -132,8 +133,6 @@ class MpvPlaybackEngine:
             log("=" * 80)
         except Exception as e:
             log(f"  - ERROR: {e}")
-            import traceback
-
             log(traceback.format_exc())
             log("=" * 80)
 
@@ -265,17 +264,17 @@ class MpvPlaybackEngine:
     def shutdown(self) -> None:
         """Shutdown the player."""
         log("MpvPlaybackEngine.shutdown() called")
-        if self.mpv is None:
+        # Detach first so a concurrent or repeated call sees nothing to do
+        player, self.mpv = self.mpv, None
+        if player is None:
             log("  - MPV was never initialized, nothing to shutdown")
             return
+        log("  - MPV reference cleared")
         try:
             log("  - Stopping playback...")
-            self.mpv.stop()
+            player.stop()
             log("  - Terminating MPV...")
-            self.mpv.terminate()
+            player.terminate()
             log("  - MPV terminated successfully")
         except Exception as e:
             log(f"  - Error during MPV shutdown: {e}")
-        finally:
-            self.mpv = None
-            log("  - MPV reference cleared")
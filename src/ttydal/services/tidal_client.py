@@ -1,6 +1,8 @@
 """Tidal API client singleton wrapper for ttydal."""
 
 import time
+import traceback
+from concurrent.futures import Future
 from functools import wraps
 from typing import Callable, TypeVar
 from requests.exceptions import ConnectionError, ChunkedEncodingError
@@ -77,15 +79,18 @@ class TidalClient:
             return
 
         log("TidalClient.__init__() called")
-        log("  - Installing API logger...")
-        install_api_logger()
-        log("  - API logger installed")
         log("  - Creating tidalapi.Session()...")
         self.session: Session = tidalapi.Session()
         log("  - Session created")
+        log("  - Installing API logger...")
+        # Only Tidal's own HTTP session is logged
+        install_api_logger(self.session.request_session)
+        log("  - API logger installed")
         log("  - Creating CredentialManager...")
         self.credentials = CredentialManager()
         log("  - CredentialManager created")
+        # Resolves when the pending OAuth login completes or expires
+        self.login_future: Future | None = None
         self._initialized = True
         log("TidalClient.__init__() completed")
 
@@ -101,13 +106,22 @@ class TidalClient:
             log(f"TidalClient.is_logged_in() failed (network change?): {e}")
             return False
 
+    @property
+    def user_id(self) -> str | None:
+        """ID of the logged-in user, or None before a session is loaded."""
+        user = self.session.user
+        return str(user.id) if user is not None else None
+
     def login(self) -> tuple[str, str]:
         """Initiate login process.
 
+        tidalapi polls for completion in the background; ``login_future``
+        resolves once the user has finished (or the code has expired).
+
         Returns:
             Tuple of (login_url, verification_code) for OAuth login
         """
-        login, _ = self.session.login_oauth()
+        login, self.login_future = self.session.login_oauth()
         return login.verification_uri_complete, login.user_code
 
     def complete_login(self) -> bool:
@@ -174,7 +188,11 @@ class TidalClient:
             log(f"  Response: Success - {len(albums)} favorite albums")
             for idx, album in enumerate(albums[:5]):  # Log first 5
                 log(
-                    f"    [{idx}] {album.name} (ID: {album.id}, tracks: {getattr(album, 'num_tracks', '?')})"
+                    "    [%d] %s (ID: %s, tracks: %s)",
+                    idx,
+                    album.name,
+                    album.id,
+                    getattr(album, "num_tracks", "?"),
                 )
             if len(albums) > 5:
                 log(f"    ... and {len(albums) - 5} more")
@@ -182,8 +200,6 @@ class TidalClient:
             return albums
         except Exception as e:
             log(f"  Response: ERROR - {e}")
-            import traceback
-
             log(traceback.format_exc())
             log("=" * 60)
             return []
@@ -207,7 +223,11 @@ class TidalClient:
             log(f"  Response: Success - {len(playlists)} playlists")
             for idx, pl in enumerate(playlists[:5]):  # Log first 5
                 log(
-                    f"    [{idx}] {pl.name} (ID: {pl.id}, tracks: {getattr(pl, 'num_tracks', '?')})"
+                    "    [%d] %s (ID: %s, tracks: %s)",
+                    idx,
+                    pl.name,
+                    pl.id,
+                    getattr(pl, "num_tracks", "?"),
                 )
             if len(playlists) > 5:
                 log(f"    ... and {len(playlists) - 5} more")
@@ -215,8 +235,6 @@ class TidalClient:
             return playlists
         except Exception as e:
             log(f"  Response: ERROR - {e}")
-            import traceback
-
             log(traceback.format_exc())
             log("=" * 60)
             return []
@@ -286,8 +304,6 @@ class TidalClient:
 
         except Exception as e:
             log(f"  Response: ERROR - {e}")
-            import traceback
-
             log(traceback.format_exc())
             log("=" * 60)
             return []
@@ -327,8 +343,6 @@ class TidalClient:
             return tracks
         except Exception as e:
             log(f"  Response: ERROR - {e}")
-            import traceback
-
             log(traceback.format_exc())
             log("=" * 60)
             return []
@@ -368,8 +382,6 @@ class TidalClient:
             return tracks
         except Exception as e:
             log(f"  Response: ERROR - {e}")
-            import traceback
-
             log(traceback.format_exc())
             log("=" * 60)
             return []
@@ -443,8 +455,6 @@ class TidalClient:
         except Exception as e:
             error_info["error"] = f"Failed to fetch track: {str(e)}"
             log(f"  Response: ERROR - {error_info['error']}")
-            import traceback
-
             log(traceback.format_exc())
             log("=" * 60)
             return None, None, error_info
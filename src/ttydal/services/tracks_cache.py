@@ -2,16 +2,13 @@
 
 Uses a custom LRU cache limited by total track count (not album count).
 This allows the search feature to search across all loaded albums.
-
-Note: We don't cache the albums list because:
-1. Users rarely reload it after initial load
-2. It's a small dataset that loads quickly
-3. Changes to favorites/playlists should reflect immediately
+The albums list itself is cached separately, see AlbumsCache.
 """
 
 import threading
 import time
 from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 
 from ttydal.logger import log
 
@@ -46,6 +43,12 @@ class TracksCache:
         self._timestamps: dict[str, float] = {}  # Track when items were added
         self.max_tracks = max_tracks or self.DEFAULT_MAX_TRACKS
         self.ttl = ttl or self.DEFAULT_TTL
+        # Bumped on every change so callers can tell when derived data is stale
+        self.version = 0
+        # Lookup and eviction counters for the whole session (kept on clear)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
         self._initialized = True
         log(
             f"TracksCache: Initialized with max_tracks={self.max_tracks}, ttl={self.ttl}"
@@ -70,6 +73,7 @@ class TracksCache:
         track_count = len(self._cache[item_id])
         del self._cache[item_id]
         self._timestamps.pop(item_id, None)
+        self.version += 1
         return track_count
 
     def _get_total_tracks(self) -> int:
@@ -88,13 +92,30 @@ class TracksCache:
         self._expire_old_entries()
 
         if item_id not in self._cache:
+            self._misses += 1
             return None
 
+        self._hits += 1
         # Move to end for LRU (O(1) with OrderedDict)
         self._cache.move_to_end(item_id)
 
         return self._cache.get(item_id)
 
+    def filter_uncached(self, item_ids: Iterable[str]) -> set[str]:
+        """Get the IDs that have no cached tracks.
+
+        Expires old entries once for the whole batch and leaves the LRU
+        order alone, unlike calling get() per ID.
+
+        Args:
+            item_ids: Album/playlist IDs to check
+
+        Returns:
+            The IDs that need fetching
+        """
+        self._expire_old_entries()
+        return {item_id for item_id in item_ids if item_id not in self._cache}
+
     def set(self, item_id: str, tracks: list[dict]) -> None:
         """Cache tracks for an album/playlist.
 
@@ -119,29 +140,29 @@ class TracksCache:
             oldest_id = next(iter(self._cache))
             evicted_count = self._remove_entry(oldest_id)
             current_total -= evicted_count
+            self._evictions += 1
             log(f"TracksCache: Evicted {oldest_id} ({evicted_count} tracks) - LRU")
 
         # Add new entry (appends to end of OrderedDict)
         self._cache[item_id] = tracks
         self._timestamps[item_id] = time.time()
+        self.version += 1
         log(f"TracksCache: Cached {len(tracks)} tracks for {item_id}")
 
-    def get_all_tracks(self) -> list[dict]:
-        """Get all cached tracks from all albums (for search).
+    def iter_tracks(self) -> Iterator[tuple[str, dict]]:
+        """Iterate over all cached tracks without copying them.
 
-        Returns:
-            List of all cached tracks with _cache_album_id added to each
+        The yielded track dicts are shared with the cache and must not be
+        mutated; build new dicts for any derived data.
+
+        Yields:
+            (album/playlist ID, track dictionary) pairs
         """
         self._expire_old_entries()
 
-        all_tracks = []
         for item_id, tracks in self._cache.items():
             for track in tracks:
-                track_copy = track.copy()
-                track_copy["_cache_album_id"] = item_id
-                all_tracks.append(track_copy)
-        log(f"TracksCache: Retrieved {len(all_tracks)} total tracks from cache")
-        return all_tracks
+                yield item_id, track
 
     def invalidate(self, item_id: str) -> None:
         """Remove a specific album/playlist from the cache.
@@ -157,13 +178,15 @@ class TracksCache:
         """Clear the entire cache."""
         self._cache.clear()
         self._timestamps.clear()
+        self.version += 1
         log("TracksCache: Cache cleared")
 
     def get_stats(self) -> dict:
         """Get cache statistics.
 
         Returns:
-            Dict with albums_count, tracks_count, max_tracks, ttl
+            Dict with albums_count, tracks_count, max_tracks, ttl, and the
+            session's get() hits and misses and LRU evictions
         """
         self._expire_old_entries()
         total_tracks = self._get_total_tracks()
@@ -172,4 +195,7 @@ class TracksCache:
             "tracks_count": total_tracks,
             "max_tracks": self.max_tracks,
             "ttl": self.ttl,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
         }